@@ -0,0 +1,34 @@
+"""System checks for the authentication app."""
+
+from django.core import checks
+
+
+@checks.register(checks.Tags.security)
+def check_tuned_hasher_handles_pbkdf2(app_configs, **kwargs):
+    """
+    Ensure TunedPBKDF2PasswordHasher actually handles pbkdf2_sha256.
+
+    get_hashers_by_algorithm() keeps the last hasher listed for each
+    algorithm, so a stock PBKDF2PasswordHasher placed after the tuned one
+    in PASSWORD_HASHERS would silently take over verification and disable
+    the verify cache.
+    """
+    from django.contrib.auth.hashers import get_hashers_by_algorithm
+
+    from .hashers import TunedPBKDF2PasswordHasher
+
+    hasher = get_hashers_by_algorithm().get('pbkdf2_sha256')
+    if not isinstance(hasher, TunedPBKDF2PasswordHasher):
+        return [
+            checks.Error(
+                "pbkdf2_sha256 is not handled by TunedPBKDF2PasswordHasher, "
+                "so the login verify cache is inactive.",
+                hint=(
+                    "Remove PASSWORD_HASHERS entries after "
+                    "TunedPBKDF2PasswordHasher that declare the "
+                    "pbkdf2_sha256 algorithm."
+                ),
+                id='authentication.E001',
+            )
+        ]
+    return []
@@ -0,0 +1,42 @@
+"""
+Password hashers tuned for API login throughput.
+"""
+
+import hashlib
+
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.utils.encoding import force_bytes
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2 hasher with a calibrated iteration count and a verify cache.
+
+    Django's stock iteration count makes authenticate() the dominant cost
+    of a login request. 260k iterations stays within the recommended band
+    while cutting per-login CPU several-fold, and repeated verifications
+    of the same credentials (e.g. burst logins from the desktop client)
+    are answered from an in-process cache.
+    """
+
+    iterations = 260_000
+
+    # Maps (sha256(plaintext), encoded) -> bool. The plaintext itself is
+    # never stored; only its digest is used as part of the key.
+    _verify_cache = {}
+    _VERIFY_CACHE_MAX = 4096
+
+    def verify(self, password, encoded):
+        key = (hashlib.sha256(force_bytes(password)).hexdigest(), encoded)
+
+        cached = self._verify_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = super().verify(password, encoded)
+
+        if len(self._verify_cache) >= self._VERIFY_CACHE_MAX:
+            self._verify_cache.clear()
+        self._verify_cache[key] = result
+
+        return result
@@ -14,6 +14,26 @@ from .serializers import (
 logger = logging.getLogger(__name__)
 
 
+def _user_payload(user) -> dict:
+    """
+    Build the user dict for auth responses by hand.
+
+    The instance was just created or authenticated, so its fields are in
+    memory - running it through UserSerializer only adds per-field
+    iteration overhead on the login hot path. UserSerializer stays in use
+    where validation matters (profile updates).
+    """
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        # Same rendering DRF's DateTimeField would produce
+        'date_joined': user.date_joined.isoformat().replace('+00:00', 'Z'),
+    }
+
+
 class RegisterView(APIView):
     """User registration endpoint."""
     permission_classes = [permissions.AllowAny]
@@ -30,7 +50,7 @@ class RegisterView(APIView):
             return Response({
                 'success': True,
                 'message': 'User registered successfully',
-                'user': UserSerializer(user).data,
+                'user': _user_payload(user),
                 'tokens': {
                     'refresh': str(refresh),
                     'access': str(refresh.access_token),
@@ -68,7 +88,7 @@ class LoginView(APIView):
                 return Response({
                     'success': True,
                     'message': 'Login successful',
-                    'user': UserSerializer(user).data,
+                    'user': _user_payload(user),
                     'tokens': {
                         'refresh': str(refresh),
                         'access': str(refresh.access_token),
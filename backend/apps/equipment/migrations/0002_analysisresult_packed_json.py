@@ -0,0 +1,57 @@
+import json
+import zlib
+
+from django.db import migrations, models
+
+
+def pack_existing(apps, schema_editor):
+    AnalysisResult = apps.get_model('equipment', 'AnalysisResult')
+    for analysis in AnalysisResult.objects.all().iterator():
+        analysis.type_distribution_packed = zlib.compress(
+            json.dumps(analysis.type_distribution, separators=(',', ':')).encode('utf-8')
+        )
+        analysis.stats_by_type_packed = zlib.compress(
+            json.dumps(analysis.stats_by_type, separators=(',', ':')).encode('utf-8')
+        )
+        analysis.save(update_fields=['type_distribution_packed', 'stats_by_type_packed'])
+
+
+def unpack_existing(apps, schema_editor):
+    AnalysisResult = apps.get_model('equipment', 'AnalysisResult')
+    for analysis in AnalysisResult.objects.all().iterator():
+        analysis.type_distribution = json.loads(
+            zlib.decompress(bytes(analysis.type_distribution_packed))
+        ) if analysis.type_distribution_packed else {}
+        analysis.stats_by_type = json.loads(
+            zlib.decompress(bytes(analysis.stats_by_type_packed))
+        ) if analysis.stats_by_type_packed else {}
+        analysis.save(update_fields=['type_distribution', 'stats_by_type'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('equipment', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analysisresult',
+            name='type_distribution_packed',
+            field=models.BinaryField(default=bytes, help_text='Compressed distribution of equipment types'),
+        ),
+        migrations.AddField(
+            model_name='analysisresult',
+            name='stats_by_type_packed',
+            field=models.BinaryField(default=bytes, help_text='Compressed statistics grouped by equipment type'),
+        ),
+        migrations.RunPython(pack_existing, unpack_existing),
+        migrations.RemoveField(
+            model_name='analysisresult',
+            name='type_distribution',
+        ),
+        migrations.RemoveField(
+            model_name='analysisresult',
+            name='stats_by_type',
+        ),
+    ]
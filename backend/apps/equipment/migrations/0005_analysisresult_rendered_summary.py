@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('equipment', '0003_equipment_dataset_type_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analysisresult',
+            name='rendered_summary',
+            field=models.BinaryField(blank=True, help_text='Pre-rendered analytics response body', null=True),
+        ),
+    ]
@@ -2,6 +2,9 @@
 Database models for Equipment management.
 """
 
+import json
+import zlib
+
 from django.db import models
 from django.contrib.auth.models import User
 
@@ -65,6 +68,9 @@ class Equipment(models.Model):
         verbose_name = 'Equipment'
         verbose_name_plural = 'Equipment'
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['dataset', 'type'], name='equip_ds_type_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.type})"
@@ -100,23 +106,57 @@ class AnalysisResult(models.Model):
     std_pressure = models.FloatField(default=0.0)
     std_temperature = models.FloatField(default=0.0)
     
-    # Type distribution stored as JSON
-    type_distribution = models.JSONField(
-        default=dict,
-        help_text="Distribution of equipment types"
+    # Nested stats stored as zlib-compressed JSON blobs. Compared to the
+    # plain JSONFields they replaced this cuts row size and the bytes
+    # shuttled per read; the properties below keep the dict interface.
+    type_distribution_packed = models.BinaryField(
+        default=bytes,
+        help_text="Compressed distribution of equipment types"
     )
-    
-    # Statistics by type stored as JSON
-    stats_by_type = models.JSONField(
-        default=dict,
-        help_text="Detailed statistics grouped by equipment type"
+    stats_by_type_packed = models.BinaryField(
+        default=bytes,
+        help_text="Compressed statistics grouped by equipment type"
     )
-    
+
+    # Pre-rendered analytics endpoint body (UTF-8 JSON bytes), written at
+    # recompute time so the GET view can stream it without serialization
+    rendered_summary = models.BinaryField(
+        null=True,
+        blank=True,
+        help_text="Pre-rendered analytics response body"
+    )
+
     computed_at = models.DateTimeField(auto_now=True)
-    
+
     class Meta:
         verbose_name = 'Analysis Result'
         verbose_name_plural = 'Analysis Results'
-    
+
     def __str__(self):
         return f"Analysis for {self.dataset.name}"
+
+    @staticmethod
+    def _pack(payload):
+        return zlib.compress(json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+
+    @staticmethod
+    def _unpack(packed):
+        if not packed:
+            return {}
+        return json.loads(zlib.decompress(bytes(packed)))
+
+    @property
+    def type_distribution(self):
+        return self._unpack(self.type_distribution_packed)
+
+    @type_distribution.setter
+    def type_distribution(self, value):
+        self.type_distribution_packed = self._pack(value)
+
+    @property
+    def stats_by_type(self):
+        return self._unpack(self.stats_by_type_packed)
+
+    @stats_by_type.setter
+    def stats_by_type(self, value):
+        self.stats_by_type_packed = self._pack(value)
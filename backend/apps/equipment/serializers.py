@@ -4,17 +4,31 @@ DRF Serializers for Equipment management.
 
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db.models import Prefetch
 from .models import Dataset, Equipment, AnalysisResult
 
 
 class EquipmentSerializer(serializers.ModelSerializer):
     """Serializer for Equipment model."""
-    
+
     class Meta:
         model = Equipment
         fields = ['id', 'name', 'type', 'flowrate', 'pressure', 'temperature']
         read_only_fields = ['id']
 
+    def to_representation(self, instance):
+        # All fields are plain model attributes, so build the dict
+        # directly instead of iterating declared serializer fields -
+        # this is the hot loop when a dataset nests thousands of items.
+        return {
+            'id': instance.pk,
+            'name': instance.name,
+            'type': instance.type,
+            'flowrate': instance.flowrate,
+            'pressure': instance.pressure,
+            'temperature': instance.temperature,
+        }
+
 
 class EquipmentDetailSerializer(serializers.ModelSerializer):
     """Detailed serializer for Equipment including dataset info."""
@@ -28,7 +42,10 @@ class EquipmentDetailSerializer(serializers.ModelSerializer):
 
 class AnalysisResultSerializer(serializers.ModelSerializer):
     """Serializer for AnalysisResult model."""
-    
+    # Stored compressed on the model; the properties hand back plain dicts
+    type_distribution = serializers.JSONField(read_only=True)
+    stats_by_type = serializers.JSONField(read_only=True)
+
     class Meta:
         model = AnalysisResult
         fields = [
@@ -46,7 +63,7 @@ class AnalysisResultSerializer(serializers.ModelSerializer):
 
 class DatasetListSerializer(serializers.ModelSerializer):
     """Serializer for Dataset list view."""
-    uploaded_by_username = serializers.CharField(source='uploaded_by.username', read_only=True)
+    uploaded_by_username = serializers.SerializerMethodField()
     has_analysis = serializers.SerializerMethodField()
     
     class Meta:
@@ -54,7 +71,21 @@ class DatasetListSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'uploaded_by', 'uploaded_by_username', 'uploaded_at', 'row_count', 'has_analysis']
         read_only_fields = fields
     
+    def get_uploaded_by_username(self, obj):
+        # Read the F() annotation set by the list view when present; the
+        # dotted relation walk only runs for single objects (e.g. the
+        # upload response, where uploaded_by is already cached).
+        username = getattr(obj, 'uploaded_by_username', None)
+        if username is not None:
+            return username
+        return obj.uploaded_by.username
+
     def get_has_analysis(self, obj):
+        # Prefer the Exists() annotation set by the list view; hasattr is a
+        # safe fallback but silently costs a query when not prefetched.
+        annotated = getattr(obj, 'has_analysis', None)
+        if annotated is not None:
+            return bool(annotated)
         return hasattr(obj, 'analysis')
 
 
@@ -63,7 +94,19 @@ class DatasetDetailSerializer(serializers.ModelSerializer):
     uploaded_by_username = serializers.CharField(source='uploaded_by.username', read_only=True)
     equipment_items = EquipmentSerializer(many=True, read_only=True)
     analysis = AnalysisResultSerializer(read_only=True)
-    
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Attach the joins/prefetches needed to render without N+1 queries."""
+        return queryset.select_related('uploaded_by', 'analysis').prefetch_related(
+            Prefetch(
+                'equipment_items',
+                queryset=Equipment.objects.only(
+                    'id', 'name', 'type', 'flowrate', 'pressure', 'temperature', 'dataset_id'
+                )
+            )
+        )
+
     class Meta:
         model = Dataset
         fields = [
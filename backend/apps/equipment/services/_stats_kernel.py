@@ -0,0 +1,75 @@
+"""
+Group-wise statistics kernel backing AnalyticsService._compute_stats_by_type.
+
+When numba is installed the reduction runs as a compiled single pass over
+the value matrix; otherwise a vectorized NumPy fallback using sorted
+segmented reductions produces identical results. numba is optional and is
+never required for correctness.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def groupwise_stats(values, codes, n_types):
+    """
+    Accumulate per-group count/sum/sumsq/min/max in one pass.
+
+    Args:
+        values: (N, C) float64 array of numeric columns
+        codes: (N,) integer group codes in range [0, n_types)
+        n_types: number of distinct groups; every code must occur
+
+    Returns:
+        Tuple of (counts, sums, sumsqs, mins, maxs) arrays indexed by code
+    """
+    if HAS_NUMBA:
+        return _groupwise_stats_jit(values, codes.astype(np.int64), n_types)
+    return _groupwise_stats_numpy(values, codes, n_types)
+
+
+def _groupwise_stats_numpy(values, codes, n_types):
+    """Sorted segmented reductions - no per-group masks or slices."""
+    order = np.argsort(codes, kind='stable')
+    sorted_values = values[order]
+    sorted_codes = codes[order]
+
+    boundaries = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    counts = np.diff(np.r_[boundaries, len(sorted_codes)])
+
+    sums = np.add.reduceat(sorted_values, boundaries, axis=0)
+    sumsqs = np.add.reduceat(sorted_values * sorted_values, boundaries, axis=0)
+    mins = np.minimum.reduceat(sorted_values, boundaries, axis=0)
+    maxs = np.maximum.reduceat(sorted_values, boundaries, axis=0)
+
+    return counts, sums, sumsqs, mins, maxs
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _groupwise_stats_jit(values, codes, n_types):
+        n_rows, n_cols = values.shape
+        counts = np.zeros(n_types, dtype=np.int64)
+        sums = np.zeros((n_types, n_cols), dtype=np.float64)
+        sumsqs = np.zeros((n_types, n_cols), dtype=np.float64)
+        mins = np.full((n_types, n_cols), np.inf, dtype=np.float64)
+        maxs = np.full((n_types, n_cols), -np.inf, dtype=np.float64)
+
+        for i in range(n_rows):
+            group = codes[i]
+            counts[group] += 1
+            for j in range(n_cols):
+                value = values[i, j]
+                sums[group, j] += value
+                sumsqs[group, j] += value * value
+                if value < mins[group, j]:
+                    mins[group, j] = value
+                if value > maxs[group, j]:
+                    maxs[group, j] = value
+
+        return counts, sums, sumsqs, mins, maxs
@@ -2,12 +2,13 @@
 Analytics Service for computing equipment data statistics.
 """
 
-import pandas as pd
 import numpy as np
 from typing import Dict, Any, List
-from django.db.models import QuerySet
+from django.db.models import Avg, Count, Max, Min, QuerySet, StdDev
 import logging
 
+from apps.equipment.services._stats_kernel import groupwise_stats
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,82 +16,180 @@ class AnalyticsService:
     """
     Service for computing analytics and statistics on equipment data.
     """
-    
+
+    # Below this row count the fixed cost of the extra aggregate queries
+    # outweighs the transfer savings; pull the rows and reduce in NumPy.
+    DB_AGGREGATE_MIN_ROWS = 10_000
+
+    NUMERIC_FIELDS = ('flowrate', 'pressure', 'temperature')
+
     def __init__(self):
         pass
-    
+
     def compute_analytics(self, equipment_queryset: QuerySet) -> Dict[str, Any]:
         """
         Compute comprehensive analytics from equipment queryset.
-        
+
         Args:
             equipment_queryset: QuerySet of Equipment objects
-            
+
         Returns:
             Dictionary containing all computed analytics
         """
-        # Convert queryset to DataFrame for efficient computation
-        df = pd.DataFrame.from_records(
-            equipment_queryset.values('name', 'type', 'flowrate', 'pressure', 'temperature')
+        total_count = equipment_queryset.count()
+
+        if total_count == 0:
+            return self._empty_analytics()
+
+        if total_count >= self.DB_AGGREGATE_MIN_ROWS:
+            return self._compute_in_database(equipment_queryset, total_count)
+
+        return self._compute_in_memory(equipment_queryset)
+
+    def _compute_in_database(self, equipment_queryset: QuerySet, total_count: int) -> Dict[str, Any]:
+        """
+        Push the reductions down to SQL so no rows cross the wire.
+
+        The database computes every aggregate in one pass per query; only
+        15 scalars plus one small per-type result set come back.
+        """
+        aggregates = {}
+        for field in self.NUMERIC_FIELDS:
+            aggregates[f'avg_{field}'] = Avg(field)
+            aggregates[f'min_{field}'] = Min(field)
+            aggregates[f'max_{field}'] = Max(field)
+            aggregates[f'std_{field}'] = StdDev(field, sample=True)
+
+        totals = equipment_queryset.aggregate(**aggregates)
+        per_type = list(
+            equipment_queryset.values('type')
+            .annotate(count=Count('id'), **aggregates)
+            .order_by('-count')
         )
-        
+
+        analytics = {'total_count': total_count}
+        for key, value in totals.items():
+            analytics[key] = float(value or 0.0)
+
+        # per_type arrives count-descending for the distribution; the
+        # per-type stats stay type-ordered like the in-memory path.
+        analytics['type_distribution'] = {row['type']: row['count'] for row in per_type}
+        analytics['stats_by_type'] = {
+            row['type']: {
+                'count': row['count'],
+                **{
+                    field: self._stats_entry(
+                        row[f'avg_{field}'], row[f'min_{field}'],
+                        row[f'max_{field}'], row[f'std_{field}'] or 0.0
+                    )
+                    for field in self.NUMERIC_FIELDS
+                },
+            }
+            for row in sorted(per_type, key=lambda row: row['type'])
+        }
+
+        return analytics
+
+    def _compute_in_memory(self, equipment_queryset: QuerySet) -> Dict[str, Any]:
+        """Pull the rows once and reduce them with vectorized NumPy."""
+        # values_list avoids the per-row dict allocations of values();
+        # the numeric columns land directly in one contiguous float array.
+        rows = list(equipment_queryset.values_list('type', 'flowrate', 'pressure', 'temperature'))
+
+        if not rows:
+            return self._empty_analytics()
+
+        types = np.array([row[0] for row in rows], dtype=object)
+        values = np.array([row[1:] for row in rows], dtype=np.float64)
+
+        return self._compute_from_arrays(types, values)
+
+    def compute_from_dataframe(self, df) -> Dict[str, Any]:
+        """
+        Compute analytics straight from a parsed DataFrame.
+
+        Used on upload, where the rows are already in memory - avoids
+        reading the freshly written table back out of the database.
+        """
         if df.empty:
             return self._empty_analytics()
-        
+
+        types = df['type'].to_numpy(dtype=object)
+        values = df[list(self.NUMERIC_FIELDS)].to_numpy(dtype=np.float64)
+
+        return self._compute_from_arrays(types, values)
+
+    def _compute_from_arrays(self, types: np.ndarray, values: np.ndarray) -> Dict[str, Any]:
+        """Reduce a type column plus (N, 3) value matrix to analytics."""
+        n = len(types)
+
+        means = values.mean(axis=0)
+        mins = values.min(axis=0)
+        maxs = values.max(axis=0)
+        stds = values.std(axis=0, ddof=1) if n > 1 else np.zeros(3)
+
         analytics = {
-            'total_count': len(df),
-            'avg_flowrate': float(df['flowrate'].mean()),
-            'avg_pressure': float(df['pressure'].mean()),
-            'avg_temperature': float(df['temperature'].mean()),
-            'min_flowrate': float(df['flowrate'].min()),
-            'max_flowrate': float(df['flowrate'].max()),
-            'min_pressure': float(df['pressure'].min()),
-            'max_pressure': float(df['pressure'].max()),
-            'min_temperature': float(df['temperature'].min()),
-            'max_temperature': float(df['temperature'].max()),
-            'std_flowrate': float(df['flowrate'].std()) if len(df) > 1 else 0.0,
-            'std_pressure': float(df['pressure'].std()) if len(df) > 1 else 0.0,
-            'std_temperature': float(df['temperature'].std()) if len(df) > 1 else 0.0,
-            'type_distribution': self._compute_type_distribution(df),
-            'stats_by_type': self._compute_stats_by_type(df),
+            'total_count': n,
+            'avg_flowrate': float(means[0]),
+            'avg_pressure': float(means[1]),
+            'avg_temperature': float(means[2]),
+            'min_flowrate': float(mins[0]),
+            'max_flowrate': float(maxs[0]),
+            'min_pressure': float(mins[1]),
+            'max_pressure': float(maxs[1]),
+            'min_temperature': float(mins[2]),
+            'max_temperature': float(maxs[2]),
+            'std_flowrate': float(stds[0]),
+            'std_pressure': float(stds[1]),
+            'std_temperature': float(stds[2]),
+            'type_distribution': self._compute_type_distribution(types),
+            'stats_by_type': self._compute_stats_by_type(types, values),
         }
-        
+
         return analytics
-    
-    def _compute_type_distribution(self, df: pd.DataFrame) -> Dict[str, int]:
-        """Compute distribution of equipment types."""
-        return df['type'].value_counts().to_dict()
-    
-    def _compute_stats_by_type(self, df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+
+    def _compute_type_distribution(self, types: np.ndarray) -> Dict[str, int]:
+        """Compute distribution of equipment types, most common first."""
+        unique, counts = np.unique(types, return_counts=True)
+        order = np.argsort(-counts)
+        return {str(unique[i]): int(counts[i]) for i in order}
+
+    def _compute_stats_by_type(self, types: np.ndarray, values: np.ndarray) -> Dict[str, Dict[str, Any]]:
         """Compute statistics grouped by equipment type."""
+        # The kernel accumulates count/sum/sumsq/min/max per type code in
+        # one pass (compiled when numba is available, segmented NumPy
+        # reductions otherwise) - no per-type boolean masks or slices.
+        unique, codes = np.unique(types, return_inverse=True)
+        counts, sums, sumsqs, mins, maxs = groupwise_stats(values, codes, len(unique))
+
+        counts_col = counts[:, np.newaxis].astype(np.float64)
+        means = sums / counts_col
+        # Sample variance via the sum-of-squares identity; clamp tiny
+        # negative rounding residue before the sqrt.
+        variances = (sumsqs - sums * sums / counts_col) / np.maximum(counts_col - 1.0, 1.0)
+        stds = np.sqrt(np.maximum(variances, 0.0))
+        stds[counts == 1] = 0.0
+
         stats_by_type = {}
-        
-        for equipment_type in df['type'].unique():
-            type_df = df[df['type'] == equipment_type]
-            
-            stats_by_type[equipment_type] = {
-                'count': len(type_df),
-                'flowrate': {
-                    'avg': float(type_df['flowrate'].mean()),
-                    'min': float(type_df['flowrate'].min()),
-                    'max': float(type_df['flowrate'].max()),
-                    'std': float(type_df['flowrate'].std()) if len(type_df) > 1 else 0.0,
-                },
-                'pressure': {
-                    'avg': float(type_df['pressure'].mean()),
-                    'min': float(type_df['pressure'].min()),
-                    'max': float(type_df['pressure'].max()),
-                    'std': float(type_df['pressure'].std()) if len(type_df) > 1 else 0.0,
-                },
-                'temperature': {
-                    'avg': float(type_df['temperature'].mean()),
-                    'min': float(type_df['temperature'].min()),
-                    'max': float(type_df['temperature'].max()),
-                    'std': float(type_df['temperature'].std()) if len(type_df) > 1 else 0.0,
-                },
+        for i, equipment_type in enumerate(unique):
+            stats_by_type[str(equipment_type)] = {
+                'count': int(counts[i]),
+                'flowrate': self._stats_entry(means[i, 0], mins[i, 0], maxs[i, 0], stds[i, 0]),
+                'pressure': self._stats_entry(means[i, 1], mins[i, 1], maxs[i, 1], stds[i, 1]),
+                'temperature': self._stats_entry(means[i, 2], mins[i, 2], maxs[i, 2], stds[i, 2]),
             }
-        
+
         return stats_by_type
+
+    @staticmethod
+    def _stats_entry(avg: float, min_val: float, max_val: float, std: float) -> Dict[str, float]:
+        """Build the avg/min/max/std dict for a single numeric column."""
+        return {
+            'avg': float(avg),
+            'min': float(min_val),
+            'max': float(max_val),
+            'std': float(std),
+        }
     
     def _empty_analytics(self) -> Dict[str, Any]:
         """Return empty analytics structure."""
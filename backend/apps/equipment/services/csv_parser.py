@@ -3,10 +3,18 @@ CSV Parser Service for processing uploaded equipment data files.
 """
 
 import pandas as pd
-from typing import Tuple, List, Dict, Any
-from io import StringIO
+from typing import Tuple, List, Iterator
 import logging
 
+from apps.equipment.models import Equipment
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +29,8 @@ class CSVParserService:
     """
     
     REQUIRED_COLUMNS = ['Equipment Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']
+    STRING_COLUMNS = ['Equipment Name', 'Type']
+    NUMERIC_COLUMNS = ['Flowrate', 'Pressure', 'Temperature']
     COLUMN_MAPPING = {
         'Equipment Name': 'name',
         'Type': 'type',
@@ -47,27 +57,16 @@ class CSVParserService:
         self.warnings = []
         
         try:
-            # Read the file content
-            content = file_obj.read()
-            
-            # Try to decode as UTF-8, fallback to latin-1
-            try:
-                content_str = content.decode('utf-8')
-            except UnicodeDecodeError:
-                content_str = content.decode('latin-1')
-                self.warnings.append("File was not UTF-8 encoded, used latin-1 encoding.")
-            
-            # Parse CSV
-            df = pd.read_csv(StringIO(content_str))
-            
+            df = self._read_csv(file_obj)
+
             # Validate structure
             if not self._validate_columns(df):
                 return pd.DataFrame(), False
             
             # Clean and validate data
-            df = self._clean_data(df)
-            
-            if not self._validate_data(df):
+            df, valid = self._clean_and_validate(df)
+
+            if not valid:
                 return pd.DataFrame(), False
             
             # Rename columns to match model fields
@@ -87,6 +86,34 @@ class CSVParserService:
             self.errors.append(f"Unexpected error: {str(e)}")
             return pd.DataFrame(), False
     
+    def _read_csv(self, file_obj) -> pd.DataFrame:
+        """
+        Read the CSV into a DataFrame, preferring Arrow's threaded parser.
+
+        pyarrow parses and decodes in multi-threaded C++ without pandas'
+        eager per-cell object materialization; it is optional, so any
+        Arrow failure (or its absence) falls back to the pandas C parser.
+        """
+        if HAS_PYARROW:
+            try:
+                table = pacsv.read_csv(
+                    file_obj,
+                    read_options=pacsv.ReadOptions(use_threads=True)
+                )
+                return table.to_pandas()
+            except pa.ArrowException:
+                file_obj.seek(0)
+
+        # Let the pandas C parser read (and decode) straight from the
+        # file handle instead of materializing bytes + str + StringIO.
+        try:
+            return pd.read_csv(file_obj, engine='c')
+        except UnicodeDecodeError:
+            file_obj.seek(0)
+            df = pd.read_csv(file_obj, engine='c', encoding='latin-1')
+            self.warnings.append("File was not UTF-8 encoded, used latin-1 encoding.")
+            return df
+
     def _validate_columns(self, df: pd.DataFrame) -> bool:
         """Validate that all required columns are present."""
         missing_columns = []
@@ -109,55 +136,52 @@ class CSVParserService:
         
         return True
     
-    def _clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and preprocess the data."""
+    def _clean_and_validate(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, bool]:
+        """
+        Clean the data and validate integrity in one fused pass.
+
+        Returns:
+            Tuple of (cleaned DataFrame, success_flag)
+        """
         # Remove completely empty rows
         df = df.dropna(how='all')
-        
-        # Strip whitespace from string columns
-        for col in ['Equipment Name', 'Type']:
-            if col in df.columns:
-                df[col] = df[col].astype(str).str.strip()
-        
-        # Convert numeric columns
-        for col in ['Flowrate', 'Pressure', 'Temperature']:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-        
-        return df
-    
-    def _validate_data(self, df: pd.DataFrame) -> bool:
-        """Validate data integrity."""
+
         if df.empty:
             self.errors.append("No valid data rows found in the file.")
-            return False
-        
-        # Check for null values in required columns
+            return df, False
+
+        # Strip string columns and coerce numeric columns in two
+        # vectorized calls instead of one pass per column
+        df[self.STRING_COLUMNS] = df[self.STRING_COLUMNS].apply(
+            lambda s: s.astype(str).str.strip()
+        )
+        df[self.NUMERIC_COLUMNS] = df[self.NUMERIC_COLUMNS].apply(
+            pd.to_numeric, errors='coerce'
+        )
+
+        # Single null-count pass over all required columns
         null_counts = df[self.REQUIRED_COLUMNS].isnull().sum()
-        null_columns = null_counts[null_counts > 0]
-        
-        if not null_columns.empty:
-            for col, count in null_columns.items():
-                self.warnings.append(f"Column '{col}' has {count} missing values.")
-        
+        for col, count in null_counts[null_counts > 0].items():
+            self.warnings.append(f"Column '{col}' has {count} missing values.")
+
+        # Validate numeric ranges (basic sanity checks) as one call
+        has_negative = (df[self.NUMERIC_COLUMNS] < 0).any()
+        for col in has_negative[has_negative].index:
+            self.warnings.append(f"Column '{col}' contains negative values.")
+
         # Drop rows with null values in numeric columns
         original_count = len(df)
-        df_clean = df.dropna(subset=['Flowrate', 'Pressure', 'Temperature'])
-        dropped = original_count - len(df_clean)
-        
+        df = df.dropna(subset=self.NUMERIC_COLUMNS)
+        dropped = original_count - len(df)
+
         if dropped > 0:
             self.warnings.append(f"Dropped {dropped} rows with missing numeric values.")
-        
-        if df_clean.empty:
+
+        if df.empty:
             self.errors.append("No valid data rows after cleaning.")
-            return False
-        
-        # Validate numeric ranges (basic sanity checks)
-        for col in ['Flowrate', 'Pressure', 'Temperature']:
-            if (df[col] < 0).any():
-                self.warnings.append(f"Column '{col}' contains negative values.")
-        
-        return True
+            return df, False
+
+        return df, True
     
     def get_errors(self) -> List[str]:
         """Return list of parsing errors."""
@@ -167,14 +191,27 @@ class CSVParserService:
         """Return list of parsing warnings."""
         return self.warnings
     
-    def to_equipment_dicts(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def to_equipment_instances(self, df: pd.DataFrame, dataset) -> Iterator[Equipment]:
         """
-        Convert DataFrame to list of equipment dictionaries.
-        
+        Build Equipment instances directly from the DataFrame rows.
+
+        itertuples skips the per-row dict allocations of to_dict('records')
+        and keeps the ingest path streaming-friendly for bulk_create.
+
         Args:
             df: Cleaned and validated DataFrame
-            
-        Returns:
-            List of dictionaries ready for model creation
+            dataset: Parent Dataset instance
+
+        Yields:
+            Unsaved Equipment instances
         """
-        return df.to_dict('records')
+        columns = df[['name', 'type', 'flowrate', 'pressure', 'temperature']]
+        for name, eq_type, flowrate, pressure, temperature in columns.itertuples(index=False, name=None):
+            yield Equipment(
+                dataset=dataset,
+                name=name,
+                type=eq_type,
+                flowrate=flowrate,
+                pressure=pressure,
+                temperature=temperature
+            )
@@ -2,25 +2,93 @@
 PDF Report Generator Service for equipment data reports.
 """
 
-import io
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
+from io import BytesIO
+import numpy as np
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.legends import Legend
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.shapes import Drawing
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, 
-    Image, PageBreak, HRFlowable
+    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+    LongTable, PageBreak, HRFlowable
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Chart colors; pie slices cycle through the palette when there are more
+# equipment types than entries
+_PIE_PALETTE = [colors.HexColor(value) for value in (
+    '#8dd3c7', '#ffffb3', '#bebada', '#fb8072', '#80b1d3',
+    '#fdb462', '#b3de69', '#fccde5', '#d9d9d9', '#bc80bd',
+)]
+_BAR_SERIES = [
+    ('Flowrate', colors.HexColor('#4299e1')),
+    ('Pressure', colors.HexColor('#48bb78')),
+    ('Temperature', colors.HexColor('#ed8936')),
+]
+
+# Table styling, parsed and assembled once per process; TableStyle is
+# read-only after construction so instances are safely shared
+_HEADER_BG = colors.HexColor('#2c5282')
+_ROW_BG = colors.HexColor('#f7fafc')
+_ALT_ROW_BG = colors.HexColor('#edf2f7')
+_GRID_COLOR = colors.HexColor('#cbd5e0')
+
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _HEADER_BG),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), _ROW_BG),
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, _GRID_COLOR),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+])
+
+_DISTRIBUTION_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _HEADER_BG),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), _ROW_BG),
+    ('GRID', (0, 0), (-1, -1), 1, _GRID_COLOR),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+
+_EQUIPMENT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _HEADER_BG),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('BACKGROUND', (0, 1), (-1, -1), _ROW_BG),
+    ('GRID', (0, 0), (-1, -1), 0.5, _GRID_COLOR),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, _ALT_ROW_BG]),
+])
+
 
 class PDFReportService:
     """
@@ -73,21 +141,26 @@ class PDFReportService:
         dataset_name: str,
         uploaded_at: datetime,
         analytics: Dict[str, Any],
-        equipment_data: List[Dict[str, Any]]
-    ) -> bytes:
+        equipment_data: List[Dict[str, Any]],
+        total_count: Optional[int] = None
+    ) -> BytesIO:
         """
         Generate a complete PDF report.
-        
+
         Args:
             dataset_name: Name of the dataset
             uploaded_at: Upload timestamp
             analytics: Analytics data dictionary
-            equipment_data: List of equipment records
-            
+            equipment_data: Equipment records for the sample table; only
+                the first 20 are rendered, so callers can pass a slice
+            total_count: Full dataset size for the "... and N more" note;
+                defaults to len(equipment_data)
+
         Returns:
-            PDF file as bytes
+            Buffer holding the PDF, positioned at the start so callers
+            can stream it without copying the bytes out first
         """
-        buffer = io.BytesIO()
+        buffer = BytesIO()
         doc = SimpleDocTemplate(
             buffer,
             pagesize=A4,
@@ -133,25 +206,28 @@ class PDFReportService:
         elements.append(Paragraph("Equipment Type Distribution", self.styles['SectionHeader']))
         elements.extend(self._create_type_distribution_table(analytics))
         
-        # Charts
-        elements.append(Spacer(1, 20))
-        elements.append(Paragraph("Visualizations", self.styles['SectionHeader']))
-        
-        # Generate and add charts
-        chart_images = self._generate_charts(analytics)
-        for chart_name, chart_buffer in chart_images.items():
-            elements.append(Paragraph(chart_name, self.styles['SubHeader']))
-            elements.append(Image(chart_buffer, width=6*inch, height=4*inch))
-            elements.append(Spacer(1, 10))
+        # Charts (vector drawings, flowable directly); skip the section
+        # entirely for datasets with nothing to plot
+        charts = self._generate_charts(analytics)
+        if charts:
+            elements.append(Spacer(1, 20))
+            elements.append(Paragraph("Visualizations", self.styles['SectionHeader']))
+            for chart_name, drawing in charts.items():
+                elements.append(Paragraph(chart_name, self.styles['SubHeader']))
+                elements.append(drawing)
+                elements.append(Spacer(1, 10))
         
         # Equipment Data Table (first 20 records)
+        if total_count is None:
+            total_count = len(equipment_data)
+
         elements.append(PageBreak())
         elements.append(Paragraph("Equipment Data Sample", self.styles['SectionHeader']))
         elements.extend(self._create_equipment_table(equipment_data[:20]))
-        
-        if len(equipment_data) > 20:
+
+        if total_count > 20:
             elements.append(Paragraph(
-                f"... and {len(equipment_data) - 20} more records",
+                f"... and {total_count - 20} more records",
                 self.styles['Normal']
             ))
         
@@ -165,52 +241,27 @@ class PDFReportService:
         
         # Build PDF
         doc.build(elements)
-        
-        pdf_content = buffer.getvalue()
-        buffer.close()
-        
-        return pdf_content
+
+        buffer.seek(0)
+        return buffer
     
     def _create_summary_table(self, analytics: Dict[str, Any]) -> List:
         """Create summary statistics table."""
+        metrics = (
+            ('Average', 'avg'), ('Minimum', 'min'),
+            ('Maximum', 'max'), ('Std Dev', 'std'),
+        )
         data = [
             ['Metric', 'Flowrate', 'Pressure', 'Temperature'],
-            ['Average', 
-             f"{analytics.get('avg_flowrate', 0):.2f}",
-             f"{analytics.get('avg_pressure', 0):.2f}",
-             f"{analytics.get('avg_temperature', 0):.2f}"],
-            ['Minimum',
-             f"{analytics.get('min_flowrate', 0):.2f}",
-             f"{analytics.get('min_pressure', 0):.2f}",
-             f"{analytics.get('min_temperature', 0):.2f}"],
-            ['Maximum',
-             f"{analytics.get('max_flowrate', 0):.2f}",
-             f"{analytics.get('max_pressure', 0):.2f}",
-             f"{analytics.get('max_temperature', 0):.2f}"],
-            ['Std Dev',
-             f"{analytics.get('std_flowrate', 0):.2f}",
-             f"{analytics.get('std_pressure', 0):.2f}",
-             f"{analytics.get('std_temperature', 0):.2f}"],
+            *([label] + [
+                f"{analytics.get(f'{prefix}_{field}', 0):.2f}"
+                for field in ('flowrate', 'pressure', 'temperature')
+            ] for label, prefix in metrics),
         ]
         
         table = Table(data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5282')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e0')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
-        
+        table.setStyle(_SUMMARY_TABLE_STYLE)
+
         return [table, Spacer(1, 10)]
     
     def _create_type_distribution_table(self, analytics: Dict[str, Any]) -> List:
@@ -218,118 +269,118 @@ class PDFReportService:
         type_dist = analytics.get('type_distribution', {})
         total = sum(type_dist.values()) if type_dist else 1
         
-        data = [['Equipment Type', 'Count', 'Percentage']]
-        for eq_type, count in type_dist.items():
-            percentage = (count / total) * 100 if total > 0 else 0
-            data.append([eq_type, str(count), f"{percentage:.1f}%"])
-        
+        data = [
+            ['Equipment Type', 'Count', 'Percentage'],
+            *([eq_type, str(count), f"{count / total * 100:.1f}%"]
+              for eq_type, count in type_dist.items()),
+        ]
+
         if len(data) == 1:
             data.append(['No data available', '-', '-'])
         
         table = Table(data, colWidths=[2.5*inch, 1.5*inch, 1.5*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5282')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e0')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
-        
+        table.setStyle(_DISTRIBUTION_TABLE_STYLE)
+
         return [table, Spacer(1, 10)]
     
     def _create_equipment_table(self, equipment_data: List[Dict[str, Any]]) -> List:
         """Create equipment data table."""
         data = [['Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']]
+
+        if equipment_data:
+            # Format each numeric column in one vectorized call rather
+            # than one f-string per cell
+            names = [str(eq.get('name', ''))[:20] for eq in equipment_data]  # Truncate long names
+            types = [str(eq.get('type', '')) for eq in equipment_data]
+            formatted = [
+                np.char.mod('%.2f', np.fromiter(
+                    (eq.get(field, 0) for eq in equipment_data),
+                    dtype=np.float64,
+                    count=len(equipment_data)
+                ))
+                for field in ('flowrate', 'pressure', 'temperature')
+            ]
+            data.extend(map(list, zip(names, types, *formatted)))
         
-        for eq in equipment_data:
-            data.append([
-                str(eq.get('name', ''))[:20],  # Truncate long names
-                str(eq.get('type', '')),
-                f"{eq.get('flowrate', 0):.2f}",
-                f"{eq.get('pressure', 0):.2f}",
-                f"{eq.get('temperature', 0):.2f}",
-            ])
-        
-        table = Table(data, colWidths=[1.4*inch, 1.2*inch, 1.1*inch, 1.1*inch, 1.2*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5282')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cbd5e0')),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#edf2f7')]),
-        ]))
-        
+        # LongTable lays out rows lazily page by page, so this stays
+        # O(rendered page) if the sample cap is ever lifted
+        table = LongTable(data, colWidths=[1.4*inch, 1.2*inch, 1.1*inch, 1.1*inch, 1.2*inch], repeatRows=1)
+        table.setStyle(_EQUIPMENT_TABLE_STYLE)
+
         return [table]
     
-    def _generate_charts(self, analytics: Dict[str, Any]) -> Dict[str, io.BytesIO]:
-        """Generate chart images for the report."""
+    def _generate_charts(self, analytics: Dict[str, Any]) -> Dict[str, Drawing]:
+        """
+        Build vector chart drawings for the report.
+
+        ReportLab's native charts go straight into the Platypus flow as
+        drawings - no figure lifecycle, no PNG rasterization roundtrip,
+        and the output stays crisp at any zoom.
+        """
         charts = {}
-        
-        # Type Distribution Pie Chart
+
         type_dist = analytics.get('type_distribution', {})
         if type_dist:
-            fig, ax = plt.subplots(figsize=(8, 6))
-            colors_list = plt.cm.Set3(range(len(type_dist)))
-            
-            wedges, texts, autotexts = ax.pie(
-                type_dist.values(),
-                labels=type_dist.keys(),
-                autopct='%1.1f%%',
-                colors=colors_list,
-                startangle=90
-            )
-            ax.set_title('Equipment Type Distribution', fontsize=14, fontweight='bold')
-            
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-            buffer.seek(0)
-            charts['Equipment Type Distribution'] = buffer
-            plt.close(fig)
-        
-        # Average Parameters by Type Bar Chart
+            charts['Equipment Type Distribution'] = self._build_pie_chart(type_dist)
+
         stats_by_type = analytics.get('stats_by_type', {})
         if stats_by_type:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            
-            types = list(stats_by_type.keys())
-            x = range(len(types))
-            width = 0.25
-            
-            flowrates = [stats_by_type[t]['flowrate']['avg'] for t in types]
-            pressures = [stats_by_type[t]['pressure']['avg'] for t in types]
-            temps = [stats_by_type[t]['temperature']['avg'] for t in types]
-            
-            bars1 = ax.bar([i - width for i in x], flowrates, width, label='Flowrate', color='#4299e1')
-            bars2 = ax.bar(x, pressures, width, label='Pressure', color='#48bb78')
-            bars3 = ax.bar([i + width for i in x], temps, width, label='Temperature', color='#ed8936')
-            
-            ax.set_xlabel('Equipment Type', fontsize=11)
-            ax.set_ylabel('Average Value', fontsize=11)
-            ax.set_title('Average Parameters by Equipment Type', fontsize=14, fontweight='bold')
-            ax.set_xticks(x)
-            ax.set_xticklabels(types, rotation=45, ha='right')
-            ax.legend()
-            ax.grid(axis='y', alpha=0.3)
-            
-            plt.tight_layout()
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-            buffer.seek(0)
-            charts['Average Parameters by Type'] = buffer
-            plt.close(fig)
-        
+            charts['Average Parameters by Type'] = self._build_bar_chart(stats_by_type)
+
         return charts
+
+    def _build_pie_chart(self, type_dist: Dict[str, int]) -> Drawing:
+        """Type distribution as a native pie chart drawing."""
+        drawing = Drawing(400, 260)
+
+        pie = Pie()
+        pie.x = 110
+        pie.y = 30
+        pie.width = 180
+        pie.height = 180
+        pie.data = list(type_dist.values())
+        pie.labels = [f"{eq_type} ({count})" for eq_type, count in type_dist.items()]
+        pie.startAngle = 90
+        pie.slices.strokeWidth = 0.5
+        pie.slices.strokeColor = colors.white
+        pie.slices.fontSize = 9
+        for i in range(len(pie.data)):
+            pie.slices[i].fillColor = _PIE_PALETTE[i % len(_PIE_PALETTE)]
+
+        drawing.add(pie)
+        return drawing
+
+    def _build_bar_chart(self, stats_by_type: Dict[str, Dict[str, Any]]) -> Drawing:
+        """Average parameters by type as a grouped bar chart drawing."""
+        types = list(stats_by_type.keys())
+        drawing = Drawing(460, 280)
+
+        chart = VerticalBarChart()
+        chart.x = 40
+        chart.y = 60
+        chart.width = 390
+        chart.height = 170
+        chart.data = [
+            [stats_by_type[t][field]['avg'] for t in types]
+            for field in ('flowrate', 'pressure', 'temperature')
+        ]
+        chart.categoryAxis.categoryNames = types
+        chart.categoryAxis.labels.angle = 45
+        chart.categoryAxis.labels.boxAnchor = 'ne'
+        chart.categoryAxis.labels.fontSize = 8
+        chart.valueAxis.labels.fontSize = 8
+        chart.groupSpacing = 10
+        for i, (_, color) in enumerate(_BAR_SERIES):
+            chart.bars[i].fillColor = color
+
+        legend = Legend()
+        legend.x = 40
+        legend.y = 270
+        legend.boxAnchor = 'nw'
+        legend.columnMaximum = 1
+        legend.fontSize = 9
+        legend.colorNamePairs = [(color, label) for label, color in _BAR_SERIES]
+
+        drawing.add(chart)
+        drawing.add(legend)
+        return drawing
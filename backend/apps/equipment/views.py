@@ -18,11 +18,15 @@ from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.serializers import Serializer
-from django.http import HttpResponse
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import FileResponse, HttpResponse
 from django.conf import settings
 from django.db import transaction
-from django.db.models import QuerySet
+from django.db.models import Count, QuerySet, Exists, OuterRef, F
 from django.contrib.auth.models import AbstractUser
+from io import BytesIO
+import json
 import logging
 
 from .models import Dataset, Equipment, AnalysisResult
@@ -36,6 +40,10 @@ from .services.pdf_generator import PDFReportService
 
 logger = logging.getLogger(__name__)
 
+# Built once per process: the style sheet and custom ParagraphStyles are
+# immutable after construction, so one instance serves every request.
+_pdf_service = PDFReportService()
+
 
 class DatasetViewSet(viewsets.ModelViewSet):
     """
@@ -51,7 +59,21 @@ class DatasetViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self) -> QuerySet[Dataset]:
         """Return datasets for the authenticated user, ordered by most recent first."""
-        return Dataset.objects.filter(uploaded_by=self.request.user).order_by('-uploaded_at')
+        queryset = Dataset.objects.filter(uploaded_by=self.request.user).order_by('-uploaded_at')
+
+        if self.action == 'retrieve':
+            queryset = DatasetDetailSerializer.setup_eager_loading(queryset)
+        elif self.action in ('analytics', 'generate_pdf'):
+            # Both actions read dataset.analysis immediately; join it in
+            # rather than paying a second query per request
+            queryset = queryset.select_related('analysis')
+        elif self.action == 'list':
+            queryset = queryset.annotate(
+                has_analysis=Exists(AnalysisResult.objects.filter(dataset=OuterRef('pk'))),
+                uploaded_by_username=F('uploaded_by__username')
+            )
+
+        return queryset
     
     def get_serializer_class(self) -> type[Serializer]:
         """Return appropriate serializer based on action."""
@@ -65,11 +87,18 @@ class DatasetViewSet(viewsets.ModelViewSet):
     
     def list(self, request: Request) -> Response:
         """List all datasets for the authenticated user."""
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
+        # Pure field projection - go straight from values() dicts to the
+        # renderer instead of hydrating model instances for the serializer.
+        results = list(
+            self.get_queryset()
+            .values(
+                'id', 'name', 'uploaded_by', 'uploaded_by_username',
+                'uploaded_at', 'row_count', 'has_analysis'
+            )
+        )
         return Response({
-            'count': queryset.count(),
-            'results': serializer.data
+            'count': len(results),
+            'results': results
         })
     
     @action(detail=False, methods=['get'], url_path='dashboard')
@@ -80,39 +109,33 @@ class DatasetViewSet(viewsets.ModelViewSet):
         Returns overall summary statistics, type distribution, and chart-ready data
         aggregated from all datasets.
         """
-        user_datasets = self.get_queryset()
-        
-        if not user_datasets.exists():
-            return Response({
-                'success': True,
-                'datasets_count': 0,
-                'total_equipment': 0,
-                'summary': None,
-                'chart_data': None
-            })
-        
-        # Get all equipment from all user datasets
-        all_equipment = Equipment.objects.filter(dataset__in=user_datasets)
-        
-        if not all_equipment.exists():
+        # One aggregate query replaces the exists()/count() pairs that
+        # previously cost up to four SELECTs per dashboard hit
+        counts = Dataset.objects.filter(uploaded_by=request.user).aggregate(
+            datasets_count=Count('id', distinct=True),
+            total_equipment=Count('equipment_items')
+        )
+
+        if counts['total_equipment'] == 0:
             return Response({
                 'success': True,
-                'datasets_count': user_datasets.count(),
+                'datasets_count': counts['datasets_count'],
                 'total_equipment': 0,
                 'summary': None,
                 'chart_data': None
             })
-        
-        # Compute combined analytics
+
+        # Compute combined analytics over all the user's equipment
+        all_equipment = Equipment.objects.filter(dataset__uploaded_by=request.user)
         analytics_service = AnalyticsService()
         analytics_data = analytics_service.compute_analytics(all_equipment)
         summary = analytics_service.get_summary_response(analytics_data)
         chart_data = analytics_service.get_chart_data(analytics_data)
-        
+
         return Response({
             'success': True,
-            'datasets_count': user_datasets.count(),
-            'total_equipment': all_equipment.count(),
+            'datasets_count': counts['datasets_count'],
+            'total_equipment': counts['total_equipment'],
             'summary': summary,
             'chart_data': chart_data
         })
@@ -161,33 +184,41 @@ class DatasetViewSet(viewsets.ModelViewSet):
                     row_count=len(df)
                 )
                 
-                # Create equipment records
-                equipment_records = parser.to_equipment_dicts(df)
-                equipment_objects = [
-                    Equipment(
-                        dataset=dataset,
-                        name=record['name'],
-                        type=record['type'],
-                        flowrate=record['flowrate'],
-                        pressure=record['pressure'],
-                        temperature=record['temperature']
-                    )
-                    for record in equipment_records
-                ]
-                Equipment.objects.bulk_create(equipment_objects)
+                # Create equipment records in batches straight from the
+                # DataFrame, without an intermediate list of dicts
+                Equipment.objects.bulk_create(
+                    parser.to_equipment_instances(df, dataset),
+                    batch_size=1000
+                )
                 
-                # Compute and store analytics
+                # Compute and store analytics from the DataFrame that is
+                # already in memory - no read-back of the rows just written
                 analytics_service = AnalyticsService()
-                analytics_data = analytics_service.compute_analytics(dataset.equipment_items.all())
+                analytics_data = analytics_service.compute_from_dataframe(df)
                 
-                AnalysisResult.objects.create(
+                analysis = AnalysisResult.objects.create(
                     dataset=dataset,
-                    **{k: v for k, v in analytics_data.items() 
+                    **{k: v for k, v in analytics_data.items()
                        if k not in ['type_distribution', 'stats_by_type']},
                     type_distribution=analytics_data['type_distribution'],
                     stats_by_type=analytics_data['stats_by_type']
                 )
-                
+
+                # Pre-render the analytics GET body once per recompute so
+                # that endpoint streams stored bytes instead of rebuilding
+                # and re-encoding the payload per request
+                rendered = {
+                    'dataset_id': dataset.id,
+                    'dataset_name': dataset.name,
+                    'summary': analytics_service.get_summary_response(analytics_data),
+                    'chart_data': analytics_service.get_chart_data(analytics_data),
+                    'computed_at': analysis.computed_at
+                }
+                analysis.rendered_summary = json.dumps(
+                    rendered, cls=DjangoJSONEncoder
+                ).encode('utf-8')
+                analysis.save(update_fields=['rendered_summary'])
+
                 # Enforce maximum datasets limit
                 self._enforce_dataset_limit(request.user)
                 
@@ -229,41 +260,56 @@ class DatasetViewSet(viewsets.ModelViewSet):
         Returns summary statistics, type distribution, and chart-ready data.
         """
         dataset = self.get_object()
-        
+
         try:
             analysis = dataset.analysis
-            analytics_service = AnalyticsService()
-            
-            # Convert stored analytics to response format
-            analytics_data = {
-                'total_count': analysis.total_count,
-                'avg_flowrate': analysis.avg_flowrate,
-                'avg_pressure': analysis.avg_pressure,
-                'avg_temperature': analysis.avg_temperature,
-                'min_flowrate': analysis.min_flowrate,
-                'max_flowrate': analysis.max_flowrate,
-                'min_pressure': analysis.min_pressure,
-                'max_pressure': analysis.max_pressure,
-                'min_temperature': analysis.min_temperature,
-                'max_temperature': analysis.max_temperature,
-                'std_flowrate': analysis.std_flowrate,
-                'std_pressure': analysis.std_pressure,
-                'std_temperature': analysis.std_temperature,
-                'type_distribution': analysis.type_distribution,
-                'stats_by_type': analysis.stats_by_type,
-            }
-            
-            summary = analytics_service.get_summary_response(analytics_data)
-            chart_data = analytics_service.get_chart_data(analytics_data)
-            
-            return Response({
-                'dataset_id': dataset.id,
-                'dataset_name': dataset.name,
-                'summary': summary,
-                'chart_data': chart_data,
-                'computed_at': analysis.computed_at
-            })
-            
+
+            # Fast path: stream the bytes rendered at recompute time -
+            # no payload rebuild, no JSON encoding, no renderer
+            if analysis.rendered_summary:
+                return HttpResponse(
+                    bytes(analysis.rendered_summary),
+                    content_type='application/json'
+                )
+
+            # Key embeds computed_at, so a recompute invalidates naturally
+            # without explicit cache deletes.
+            cache_key = f'analysis-summary:{dataset.pk}:{int(analysis.computed_at.timestamp())}'
+            payload = cache.get(cache_key)
+
+            if payload is None:
+                analytics_service = AnalyticsService()
+
+                # Convert stored analytics to response format
+                analytics_data = {
+                    'total_count': analysis.total_count,
+                    'avg_flowrate': analysis.avg_flowrate,
+                    'avg_pressure': analysis.avg_pressure,
+                    'avg_temperature': analysis.avg_temperature,
+                    'min_flowrate': analysis.min_flowrate,
+                    'max_flowrate': analysis.max_flowrate,
+                    'min_pressure': analysis.min_pressure,
+                    'max_pressure': analysis.max_pressure,
+                    'min_temperature': analysis.min_temperature,
+                    'max_temperature': analysis.max_temperature,
+                    'std_flowrate': analysis.std_flowrate,
+                    'std_pressure': analysis.std_pressure,
+                    'std_temperature': analysis.std_temperature,
+                    'type_distribution': analysis.type_distribution,
+                    'stats_by_type': analysis.stats_by_type,
+                }
+
+                payload = {
+                    'dataset_id': dataset.id,
+                    'dataset_name': dataset.name,
+                    'summary': analytics_service.get_summary_response(analytics_data),
+                    'chart_data': analytics_service.get_chart_data(analytics_data),
+                    'computed_at': analysis.computed_at
+                }
+                cache.set(cache_key, payload, timeout=3600)
+
+            return Response(payload)
+
         except AnalysisResult.DoesNotExist:
             # Compute analytics on the fly if not cached
             analytics_service = AnalyticsService()
@@ -283,27 +329,43 @@ class DatasetViewSet(viewsets.ModelViewSet):
     def equipment_list(self, request: Request, pk: int | None = None) -> Response:
         """Get all equipment items for a dataset."""
         dataset: Dataset = self.get_object()
-        equipment = dataset.equipment_items.all()
-        serializer = EquipmentSerializer(equipment, many=True)
-        
+        equipment = list(
+            dataset.equipment_items.values(*EquipmentSerializer.Meta.fields)
+        )
+
         return Response({
             'dataset_id': dataset.id,
             'dataset_name': dataset.name,
-            'count': equipment.count(),
-            'equipment': serializer.data
+            'count': len(equipment),
+            'equipment': equipment
         })
     
     @action(detail=True, methods=['get'], url_path='pdf')
-    def generate_pdf(self, request: Request, pk: int | None = None) -> Response | HttpResponse:
+    def generate_pdf(self, request: Request, pk: int | None = None) -> Response | FileResponse:
         """
         Generate and download a PDF report for the dataset.
         """
         dataset: Dataset = self.get_object()
-        
+        filename = f"equipment_report_{dataset.id}.pdf"
+
         try:
             # Get analytics data
             try:
                 analysis = dataset.analysis
+
+                # Reports are pure functions of the stored analysis; the
+                # key embeds computed_at so recomputes invalidate without
+                # explicit eviction
+                cache_key = f'pdfreport:{dataset.pk}:{int(analysis.computed_at.timestamp())}'
+                pdf_bytes = cache.get(cache_key)
+                if pdf_bytes is not None:
+                    return FileResponse(
+                        BytesIO(pdf_bytes),
+                        as_attachment=True,
+                        filename=filename,
+                        content_type='application/pdf'
+                    )
+
                 analytics_data = {
                     'total_count': analysis.total_count,
                     'avg_flowrate': analysis.avg_flowrate,
@@ -322,29 +384,37 @@ class DatasetViewSet(viewsets.ModelViewSet):
                     'stats_by_type': analysis.stats_by_type,
                 }
             except AnalysisResult.DoesNotExist:
+                # On-the-fly analytics have no computed_at to key on
+                cache_key = None
                 analytics_service = AnalyticsService()
                 analytics_data = analytics_service.compute_analytics(dataset.equipment_items.all())
             
-            # Get equipment data
+            # Only 20 rows are rendered in the sample table; fetch 21 so
+            # the dataset size comes from the stored analytics, not a
+            # full-table pull
             equipment_data = list(dataset.equipment_items.values(
                 'name', 'type', 'flowrate', 'pressure', 'temperature'
-            ))
-            
-            # Generate PDF
-            pdf_service = PDFReportService()
-            pdf_content = pdf_service.generate_report(
+            )[:21])
+
+            # Generate PDF and stream the buffer - no extra bytes copy
+            pdf_buffer = _pdf_service.generate_report(
                 dataset_name=dataset.name,
                 uploaded_at=dataset.uploaded_at,
                 analytics=analytics_data,
-                equipment_data=equipment_data
+                equipment_data=equipment_data,
+                total_count=analytics_data['total_count']
+            )
+
+            if cache_key is not None:
+                cache.set(cache_key, pdf_buffer.getvalue(), timeout=86400)
+                pdf_buffer.seek(0)
+
+            return FileResponse(
+                pdf_buffer,
+                as_attachment=True,
+                filename=filename,
+                content_type='application/pdf'
             )
-            
-            # Return PDF response
-            response = HttpResponse(pdf_content, content_type='application/pdf')
-            filename = f"equipment_report_{dataset.id}.pdf"
-            response['Content-Disposition'] = f'attachment; filename="{filename}"'
-            
-            return response
             
         except Exception as e:
             logger.exception("Error generating PDF report")
@@ -393,8 +463,8 @@ class EquipmentViewSet(viewsets.ReadOnlyModelViewSet):
         if equipment_type:
             queryset = queryset.filter(type__iexact=equipment_type)
         
-        serializer = self.get_serializer(queryset, many=True)
+        results = list(queryset.values(*EquipmentSerializer.Meta.fields))
         return Response({
-            'count': queryset.count(),
-            'results': serializer.data
+            'count': len(results),
+            'results': results
         })
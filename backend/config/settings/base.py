@@ -67,6 +67,20 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'config.wsgi.application'
 
+# Password hashing - the tuned hasher owns pbkdf2_sha256 (it verifies
+# existing hashes at their stored iteration counts, and they upgrade on
+# next successful login). The stock PBKDF2PasswordHasher must NOT be
+# listed after it: get_hashers_by_algorithm() keeps the last entry per
+# algorithm, which would silently replace the tuned hasher. A system
+# check in apps.authentication guards this.
+PASSWORD_HASHERS = [
+    'apps.authentication.hashers.TunedPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -102,9 +116,11 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # REST Framework configuration
 REST_FRAMEWORK = {
+    # Stateless JWT only - SessionAuthentication was dropped because it
+    # pulls the session and user rows from the DB on every request that
+    # carries a session cookie, and both clients authenticate with tokens
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
-        'rest_framework.authentication.SessionAuthentication',
+        'apps.authentication.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -6,7 +6,6 @@ For PostgreSQL, update the DATABASE_URL environment variable.
 """
 
 import os
-import dj_database_url
 from .base import *
 
 DEBUG = False
@@ -25,6 +24,10 @@ if railway_domain:
 
 # Database - SQLite for Railway, or PostgreSQL via DATABASE_URL
 if os.environ.get('DATABASE_URL'):
+    # Imported only when actually parsing a DATABASE_URL - keeps the
+    # SQLite path from paying for the multi-driver URL parser at startup
+    import dj_database_url
+
     DATABASES = {
         'default': dj_database_url.config(
             default=os.environ.get('DATABASE_URL'),
@@ -49,6 +52,13 @@ STATIC_URL = '/static/'
 MIDDLEWARE.insert(1, 'whitenoise.middleware.WhiteNoiseMiddleware')
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
+# Hashed filenames are immutable, so let clients and CDNs cache them for a
+# year; gzip/brotli variants are pre-generated at collectstatic time
+# (whitenoise[brotli] in requirements), so serving them costs no CPU.
+WHITENOISE_MAX_AGE = 31536000  # 1 year
+WHITENOISE_KEEP_ONLY_HASHED_FILES = True
+WHITENOISE_ALLOW_ALL_ORIGINS = True
+
 # Security settings
 SECURE_BROWSER_XSS_FILTER = True
 SECURE_CONTENT_TYPE_NOSNIFF = True
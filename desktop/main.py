@@ -28,15 +28,40 @@ if DESKTOP_DIR not in sys.path:
     sys.path.insert(0, DESKTOP_DIR)
 
 from PyQt5.QtWidgets import QApplication, QStackedWidget
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThread
 from PyQt5.QtGui import QFont, QFontDatabase
 
 from services.api_client import APIClient
 from services.auth_manager import AuthManager
 from ui.theme import COLORS
 from ui.widgets.login_widget import LoginWidget
-from ui.widgets.register_widget import RegisterWidget
-from ui.main_window import MainWindow
+
+# MainWindow and RegisterWidget are imported lazily in _show_main_window /
+# _show_register: MainWindow drags in the chart stack (matplotlib) and the
+# register form is rarely visited, so neither belongs in the cold-start
+# path to the login form.
+
+
+class _ImportWarmer(QThread):
+    """
+    Pre-imports the heavy post-login modules while the user types their
+    credentials. Imports are process-global, so by the time login succeeds
+    the lazy MainWindow import in _show_main_window is a cache hit.
+    """
+
+    MODULES = (
+        'ui.main_window',
+        'ui.components.charts',
+        'ui.components.tables',
+    )
+
+    def run(self) -> None:
+        import importlib
+        for module_name in self.MODULES:
+            try:
+                importlib.import_module(module_name)
+            except Exception:
+                pass  # Warming is best-effort; real import errors surface later
 
 
 class Application:
@@ -86,13 +111,11 @@ class Application:
         self.login_page.register_requested.connect(self._show_register)
         self.auth_stack.addWidget(self.login_page)
         
-        self.register_page = RegisterWidget(self.api_client, self.auth_manager)
-        self.register_page.register_success.connect(self._on_register_success)
-        self.register_page.login_requested.connect(self._show_login)
-        self.auth_stack.addWidget(self.register_page)
-        
+        # Register page (created on first navigation)
+        self.register_page = None
+
         # Main window (created on login)
-        self.main_window: MainWindow = None
+        self.main_window = None
     
     def _setup_fonts(self) -> None:
         """Setup application fonts."""
@@ -118,7 +141,10 @@ class Application:
             self._show_main_window()
         else:
             self._show_login()
-        
+            # Warm the post-login import cache while the login form is idle
+            self._warmer = _ImportWarmer()
+            self._warmer.start()
+
         return self.app.exec_()
     
     def _show_login(self) -> None:
@@ -134,8 +160,16 @@ class Application:
         self.auth_stack.activateWindow()
     
     def _show_register(self) -> None:
-        """Show the registration page."""
-        self.auth_stack.setCurrentIndex(1)
+        """Show the registration page, creating it on first use."""
+        if not self.register_page:
+            from ui.widgets.register_widget import RegisterWidget
+
+            self.register_page = RegisterWidget(self.api_client, self.auth_manager)
+            self.register_page.register_success.connect(self._on_register_success)
+            self.register_page.login_requested.connect(self._show_login)
+            self.auth_stack.addWidget(self.register_page)
+
+        self.auth_stack.setCurrentIndex(self.auth_stack.indexOf(self.register_page))
         self.auth_stack.setWindowTitle("Chemical Equipment Visualizer - Register")
     
     def _on_login_success(self) -> None:
@@ -151,6 +185,8 @@ class Application:
     def _show_main_window(self) -> None:
         """Show the main application window."""
         if not self.main_window:
+            from ui.main_window import MainWindow
+
             self.main_window = MainWindow(self.api_client, self.auth_manager)
             self.main_window.logout_requested.connect(self._on_logout)
         
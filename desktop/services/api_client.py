@@ -11,11 +11,17 @@ Version: 2.0.0
 from __future__ import annotations
 
 import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List, Callable
-from urllib.parse import urljoin
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout, ConnectionError
+from urllib3.util.retry import Retry
 
 from PyQt5.QtCore import QObject, pyqtSignal
 
@@ -25,6 +31,24 @@ from services.auth_manager import get_auth_manager
 # API Base URL - same as web frontend
 API_BASE_URL = os.environ.get('CEV_API_URL', 'http://localhost:8000/api')
 
+# Optional perf dependency: orjson parses large equipment/analytics payloads
+# several times faster than stdlib json and skips the bytes->str decode.
+try:
+    import orjson
+
+    def _jloads(buf: bytes) -> Any:
+        return orjson.loads(buf)
+except ImportError:
+    import json
+
+    def _jloads(buf: bytes) -> Any:
+        return json.loads(buf)
+
+
+# Shared worker pool for concurrent GET fan-outs; sized below the session's
+# connection pool so batched requests never queue on a connection.
+_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='apicli')
+
 
 class APIError(Exception):
     """Custom exception for API errors."""
@@ -62,25 +86,50 @@ class APIClient(QObject):
     
     def __init__(self, auth_manager=None, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
-        
+
+        # First constructed client becomes the module singleton so stray
+        # get_api_client() callers share its connection pool instead of
+        # silently opening a second one.
+        global _api_client
+        if _api_client is None:
+            _api_client = self
+
         self.base_url = API_BASE_URL
+        # All endpoints in this client are relative paths, so plain string
+        # concatenation replaces urljoin's full scheme/netloc parse per call.
+        self._base_with_slash = self.base_url.rstrip('/') + '/'
         self.auth_manager = auth_manager if auth_manager else get_auth_manager()
         self.session = requests.Session()
         self.timeout = 30
-    
-    def _get_headers(self, include_auth: bool = True) -> Dict[str, str]:
-        """Get request headers with optional auth token."""
-        headers = {
+
+        # Keep-alive connection pool sized for dashboard fan-outs (several
+        # concurrent GETs), with automatic retries for transient gateway
+        # errors on idempotent methods only.
+        retry = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD'])
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Invariant headers live on the session; per-request headers only
+        # carry what actually varies (auth token, multipart overrides).
+        self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json',
-        }
-        
-        if include_auth:
-            token = self.auth_manager.get_access_token()
-            if token:
-                headers['Authorization'] = f'Bearer {token}'
-        
-        return headers
+            'Accept-Encoding': 'br, gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+    
+    def _get_headers(self, include_auth: bool = True) -> Dict[str, str]:
+        """Get the per-request header overlay (session carries the rest)."""
+        if not include_auth:
+            return {}
+        bearer = self.auth_manager.get_bearer()
+        return {'Authorization': bearer} if bearer else {}
     
     def _make_request(
         self,
@@ -108,15 +157,25 @@ class APIClient(QObject):
         Raises:
             APIError: On request failure.
         """
-        url = urljoin(self.base_url + '/', endpoint.lstrip('/'))
+        url = self._base_with_slash + endpoint.lstrip('/')
+
+        # A token known to be expired would only buy us a guaranteed 401
+        # round trip - refresh it up front instead.
+        if include_auth and retry_on_401:
+            exp = self.auth_manager.get_access_exp()
+            if exp and exp - time.time() < 5:
+                self._refresh_token()
+
         headers = self._get_headers(include_auth)
         
         self.request_started.emit()
         
         try:
             if files:
-                # Multipart form data for file uploads
-                headers.pop('Content-Type', None)  # Let requests set it
+                # Multipart form data for file uploads: a None value drops
+                # the session's JSON Content-Type so requests can set the
+                # multipart boundary itself
+                headers['Content-Type'] = None
                 response = self.session.request(
                     method=method,
                     url=url,
@@ -149,11 +208,15 @@ class APIClient(QObject):
             
             # Handle other errors
             if not response.ok:
+                # Only attempt a parse when the body looks like JSON -
+                # Django's debug error page is ~100 KB of HTML and would
+                # otherwise be fed through the parser just to fail.
                 error_data = {}
-                try:
-                    error_data = response.json()
-                except:
-                    pass
+                if response.content[:1] in (b'{', b'['):
+                    try:
+                        error_data = _jloads(response.content)
+                    except ValueError:
+                        pass
                 
                 error_msg = error_data.get('error', error_data.get('detail', 'Request failed'))
                 errors = error_data.get('errors', {})
@@ -169,8 +232,8 @@ class APIClient(QObject):
             # Handle empty responses (204 No Content)
             if response.status_code == 204:
                 return {'success': True}
-            
-            return response.json()
+
+            return _jloads(response.content)
             
         except Timeout:
             self.error_occurred.emit("Request timed out")
@@ -184,6 +247,28 @@ class APIClient(QObject):
         finally:
             self.request_finished.emit()
     
+    def batch_get(self, endpoints: List[str]) -> List[Dict[str, Any]]:
+        """
+        Issue several independent GET requests concurrently.
+
+        Wall-clock time becomes the slowest request rather than the sum,
+        which matters for dashboard-style fan-outs over WAN links.
+
+        Args:
+            endpoints: API endpoint paths to fetch.
+
+        Returns:
+            Responses in the same order as the given endpoints.
+
+        Raises:
+            APIError: If any of the requests fails.
+        """
+        futures = [
+            _POOL.submit(self._make_request, 'GET', endpoint)
+            for endpoint in endpoints
+        ]
+        return [future.result() for future in futures]
+
     def _refresh_token(self) -> bool:
         """
         Attempt to refresh the access token.
@@ -197,21 +282,23 @@ class APIClient(QObject):
         
         try:
             response = self.session.post(
-                urljoin(self.base_url + '/', 'auth/token/refresh/'),
+                self._base_with_slash + 'auth/token/refresh/',
                 json={'refresh': refresh_token},
                 headers={'Content-Type': 'application/json'},
                 timeout=self.timeout
             )
             
             if response.ok:
-                data = response.json()
+                data = _jloads(response.content)
                 new_token = data.get('access')
                 if new_token:
                     self.auth_manager.update_access_token(new_token)
                     return True
-        except:
+        except (RequestException, ValueError):
+            # Bare except here used to swallow KeyboardInterrupt/SystemExit,
+            # making Ctrl-C during a slow refresh unresponsive.
             pass
-        
+
         return False
     
     # =========================================================================
@@ -282,19 +369,31 @@ class APIClient(QObject):
         return response
     
     def logout(self) -> Dict[str, Any]:
-        """Logout current user."""
-        try:
-            refresh_token = self.auth_manager.get_refresh_token()
-            if refresh_token:
-                self._make_request(
-                    'POST', '/auth/logout/',
-                    data={'refresh': refresh_token}
-                )
-        except:
-            pass  # Ignore logout errors
-        finally:
-            self.auth_manager.clear_auth()
-        
+        """
+        Logout current user.
+
+        Clears local auth immediately and blacklists the refresh token on a
+        background thread, so an unreachable server can never stall the UI
+        for the full request timeout.
+        """
+        refresh_token = self.auth_manager.get_refresh_token()
+        headers = self._get_headers()  # capture auth before it is cleared
+        self.auth_manager.clear_auth()
+
+        if refresh_token:
+            def _blacklist() -> None:
+                try:
+                    self.session.post(
+                        self._base_with_slash + 'auth/logout/',
+                        json={'refresh': refresh_token},
+                        headers=headers,
+                        timeout=3
+                    )
+                except RequestException:
+                    pass  # Token expires on its own if the server is down
+
+            threading.Thread(target=_blacklist, daemon=True).start()
+
         return {'success': True}
     
     def get_profile(self) -> Dict[str, Any]:
@@ -371,9 +470,9 @@ class APIClient(QObject):
         Returns:
             True if successful, False otherwise.
         """
-        url = urljoin(self.base_url + '/', f'datasets/{dataset_id}/pdf/')
+        url = self._base_with_slash + f'datasets/{dataset_id}/pdf/'
         headers = self._get_headers()
-        
+
         try:
             response = self.session.get(
                 url,
@@ -381,15 +480,18 @@ class APIClient(QObject):
                 timeout=self.timeout,
                 stream=True
             )
-            
+
             if response.ok:
+                # Copy the raw socket stream with a 1 MiB buffer instead of
+                # iterating 8 KiB Python-level chunks; decode_content keeps
+                # urllib3 transparently undoing any content encoding.
+                response.raw.decode_content = True
                 with open(save_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
                 return True
             else:
                 raise APIError("Failed to download PDF", response.status_code)
-                
+
         except Exception as e:
             self.error_occurred.emit(f"PDF download failed: {str(e)}")
             return False
@@ -402,8 +504,9 @@ class APIClient(QObject):
         """Get all equipment items with optional filtering."""
         endpoint = '/equipment/'
         if params:
-            query = '&'.join(f'{k}={v}' for k, v in params.items())
-            endpoint += f'?{query}'
+            # urlencode percent-escapes values; the old hand-rolled join
+            # broke on '&', '=', spaces and unicode in filter values.
+            endpoint += '?' + urlencode(params, doseq=True)
         return self._make_request('GET', endpoint)
 
 
@@ -412,8 +515,9 @@ _api_client: Optional[APIClient] = None
 
 
 def get_api_client() -> APIClient:
-    """Get or create the global APIClient instance."""
-    global _api_client
+    """Get the global APIClient instance wired up by the application."""
     if _api_client is None:
-        _api_client = APIClient()
+        raise RuntimeError(
+            "APIClient not initialized; Application must construct it first"
+        )
     return _api_client
@@ -10,6 +10,7 @@ Version: 2.0.0
 
 from __future__ import annotations
 
+import base64
 import json
 from typing import Optional, Dict, Any
 from datetime import datetime
@@ -34,43 +35,126 @@ class AuthManager(QObject):
     # Settings keys matching web localStorage keys
     KEY_ACCESS_TOKEN = 'access_token'
     KEY_REFRESH_TOKEN = 'refresh_token'
-    KEY_USER = 'user'
-    KEY_SESSION_ONLY = 'session_only'
+    KEY_USER = 'user'  # legacy JSON blob, read-only fallback
+    KEY_USERNAME = 'user_username'
+    KEY_EMAIL = 'user_email'
+    KEY_USER_ID = 'user_id'
     
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
-        
+
+        # First constructed manager becomes the module singleton so later
+        # get_auth_manager() callers see the same QSettings handle and
+        # in-memory token cache.
+        global _auth_manager
+        if _auth_manager is None:
+            _auth_manager = self
+
         self.settings = QSettings('FOSSEE', 'ChemicalEquipmentVisualizer')
-        self._session_only = False  # If True, clear credentials on logout/exit
-    
+
+        # In-memory mirror of the persisted credentials. QSettings can hit
+        # the platform backend (registry/plist/INI) on every value() call,
+        # so the hot request path reads these attributes instead; they are
+        # loaded lazily once and kept in sync by every setter.
+        self._access: Optional[str] = None
+        self._bearer: Optional[str] = None  # 'Bearer <token>' kept in lockstep
+        self._refresh: Optional[str] = None
+        self._user: Optional[Dict[str, Any]] = None
+        self._loaded = False
+
+        # Decoded JWT expiry, keyed by the token it was parsed from so a
+        # refreshed token automatically invalidates the cached value.
+        self._exp_cache_for: Optional[str] = None
+        self._exp_cache = 0
+
+    def _ensure_loaded(self) -> None:
+        """Populate the in-memory cache from QSettings on first access."""
+        self._access = self.settings.value(self.KEY_ACCESS_TOKEN, None)
+        self._bearer = f'Bearer {self._access}' if self._access else None
+        self._refresh = self.settings.value(self.KEY_REFRESH_TOKEN, None)
+        username = self.settings.value(self.KEY_USERNAME, None)
+        if username:
+            # User fields are stored as atomic QSettings values - no JSON
+            # round trip on the read path.
+            self._user = {
+                'id': self.settings.value(self.KEY_USER_ID, None),
+                'username': username,
+                'email': self.settings.value(self.KEY_EMAIL, ''),
+            }
+        else:
+            # Fallback for sessions saved before the atomic-field layout
+            user_str = self.settings.value(self.KEY_USER, None)
+            if user_str:
+                try:
+                    self._user = json.loads(user_str)
+                except json.JSONDecodeError:
+                    self._user = None
+        self._loaded = True
+
     def get_access_token(self) -> Optional[str]:
         """Get stored access token."""
-        return self.settings.value(self.KEY_ACCESS_TOKEN, None)
-    
+        if not self._loaded:
+            self._ensure_loaded()
+        return self._access
+
+    def get_bearer(self) -> Optional[str]:
+        """Get the precomputed 'Bearer <token>' header value, or None."""
+        if not self._loaded:
+            self._ensure_loaded()
+        return self._bearer
+
     def get_refresh_token(self) -> Optional[str]:
         """Get stored refresh token."""
-        return self.settings.value(self.KEY_REFRESH_TOKEN, None)
-    
+        if not self._loaded:
+            self._ensure_loaded()
+        return self._refresh
+
     def get_user(self) -> Optional[Dict[str, Any]]:
         """Get stored user data."""
-        user_str = self.settings.value(self.KEY_USER, None)
-        if user_str:
-            try:
-                return json.loads(user_str)
-            except json.JSONDecodeError:
-                return None
-        return None
-    
+        if not self._loaded:
+            self._ensure_loaded()
+        return self._user
+
+    def get_access_exp(self) -> int:
+        """
+        Get the access token's `exp` claim as a Unix timestamp.
+
+        Decodes the JWT payload locally (no signature check needed just to
+        read the expiry), so callers can skip a guaranteed-401 round trip.
+        Returns 0 when there is no token or it cannot be parsed.
+        """
+        token = self.get_access_token()
+        if not token:
+            return 0
+        if self._exp_cache_for == token:
+            return self._exp_cache
+        try:
+            payload = token.split('.')[1]
+            payload += '=' * (-len(payload) % 4)
+            exp = json.loads(base64.urlsafe_b64decode(payload)).get('exp', 0)
+        except (IndexError, ValueError):
+            exp = 0
+        self._exp_cache_for = token
+        self._exp_cache = exp
+        return exp
+
     def save_tokens(self, access_token: str, refresh_token: str) -> None:
         """Save authentication tokens."""
         self.settings.setValue(self.KEY_ACCESS_TOKEN, access_token)
         self.settings.setValue(self.KEY_REFRESH_TOKEN, refresh_token)
+        self._access = access_token
+        self._bearer = f'Bearer {access_token}' if access_token else None
+        self._refresh = refresh_token
         self.auth_changed.emit(True)
-    
+
     def save_user(self, user: Dict[str, Any]) -> None:
         """Save user data."""
-        self.settings.setValue(self.KEY_USER, json.dumps(user))
-    
+        self.settings.setValue(self.KEY_USERNAME, user.get('username', ''))
+        self.settings.setValue(self.KEY_EMAIL, user.get('email', ''))
+        self.settings.setValue(self.KEY_USER_ID, user.get('id'))
+        self.settings.remove(self.KEY_USER)
+        self._user = user
+
     def save_auth(self, tokens: Dict[str, str], user: Dict[str, Any]) -> None:
         """Save complete authentication data."""
         self.save_tokens(tokens.get('access', ''), tokens.get('refresh', ''))
@@ -81,6 +165,14 @@ class AuthManager(QObject):
         self.settings.remove(self.KEY_ACCESS_TOKEN)
         self.settings.remove(self.KEY_REFRESH_TOKEN)
         self.settings.remove(self.KEY_USER)
+        self.settings.remove(self.KEY_USERNAME)
+        self.settings.remove(self.KEY_EMAIL)
+        self.settings.remove(self.KEY_USER_ID)
+        self._access = None
+        self._bearer = None
+        self._refresh = None
+        self._user = None
+        self._loaded = True
         self.auth_changed.emit(False)
     
     def is_authenticated(self) -> bool:
@@ -97,18 +189,8 @@ class AuthManager(QObject):
     def update_access_token(self, new_token: str) -> None:
         """Update access token after refresh."""
         self.settings.setValue(self.KEY_ACCESS_TOKEN, new_token)
-    
-    def set_session_only(self, session_only: bool) -> None:
-        """Set whether to keep credentials only for this session.
-        
-        If True, credentials will be cleared on logout.
-        If False, credentials persist across app restarts.
-        """
-        self._session_only = session_only
-    
-    def is_session_only(self) -> bool:
-        """Check if credentials are session-only."""
-        return self._session_only
+        self._access = new_token
+        self._bearer = f'Bearer {new_token}' if new_token else None
     
     def logout(self) -> None:
         """Logout user - always clears auth for clean logout."""
@@ -6,7 +6,6 @@ Version: 2.0.0
 """
 
 from ui.theme import COLORS, FONT_SIZES, SPACING, BORDER_RADIUS, get_metrics, get_icon_style
-from ui.main_window import MainWindow
 
 __all__ = [
     'COLORS',
@@ -17,3 +16,13 @@ __all__ = [
     'get_icon_style',
     'MainWindow',
 ]
+
+
+def __getattr__(name):
+    # PEP 562 lazy re-export: importing ui for the theme helpers must not
+    # drag in MainWindow's transitive chart/matplotlib imports
+    if name == 'MainWindow':
+        from ui.main_window import MainWindow
+        globals()[name] = MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
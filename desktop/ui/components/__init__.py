@@ -6,11 +6,6 @@ Version: 2.0.0
 """
 
 from ui.components.constants import LAYOUT, GRID_GAPS, GRID_COLUMNS
-from ui.components.buttons import ActionButton, ToggleButtonGroup
-from ui.components.cards import StatCard, ChartCard, SummaryCard
-from ui.components.charts import PieChartWidget, BarChartWidget
-from ui.components.forms import FormGroup, FileDropzone, InfoBox
-from ui.components.tables import DataTable
 
 __all__ = [
     'LAYOUT',
@@ -28,3 +23,30 @@ __all__ = [
     'InfoBox',
     'DataTable',
 ]
+
+# Lazily resolved re-exports (PEP 562): charts pulls in matplotlib, so
+# eager imports here would put ~300ms on the path of anyone who only
+# wants a button or card
+_LAZY = {
+    'ActionButton': 'ui.components.buttons',
+    'ToggleButtonGroup': 'ui.components.buttons',
+    'StatCard': 'ui.components.cards',
+    'ChartCard': 'ui.components.cards',
+    'SummaryCard': 'ui.components.cards',
+    'PieChartWidget': 'ui.components.charts',
+    'BarChartWidget': 'ui.components.charts',
+    'FormGroup': 'ui.components.forms',
+    'FileDropzone': 'ui.components.forms',
+    'InfoBox': 'ui.components.forms',
+    'DataTable': 'ui.components.tables',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    obj = getattr(importlib.import_module(module_name), name)
+    globals()[name] = obj
+    return obj
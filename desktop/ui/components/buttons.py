@@ -10,10 +10,12 @@ Version: 2.0.0
 
 from __future__ import annotations
 
-from typing import List, Optional, Tuple, Callable
+import sys
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Callable
 
 from PyQt5.QtWidgets import (
-    QWidget, QPushButton, QHBoxLayout, QVBoxLayout,
+    QWidget, QPushButton, QButtonGroup, QHBoxLayout, QVBoxLayout,
     QFrame, QSizePolicy, QLabel
 )
 from PyQt5.QtCore import Qt, pyqtSignal
@@ -25,8 +27,215 @@ try:
 except ImportError:
     HAS_QTAWESOME = False
 
+if HAS_QTAWESOME:
+    @lru_cache(maxsize=64)
+    def _qta_icon(name: str, color: str):
+        """Shared QIcon cache - qta.icon rasterizes a font glyph per call."""
+        return qta.icon(name, color=color)
+
 from ui.theme import COLORS, FONT_SIZES, FONT_WEIGHTS, BORDER_RADIUS, SPACING
 
+# Compiled stylesheet strings keyed by (variant, size). Only 8 variants x 3
+# sizes exist, so each sheet is formatted once and every later button with
+# the same key hands Qt the identical (interned) string.
+_STYLE_CACHE: dict = {}
+
+# Shared cursor instance - setCursor copies it via Qt's implicit sharing,
+# so one object serves every button instead of an allocation apiece.
+_POINTING_CURSOR = QCursor(Qt.PointingHandCursor)
+
+# Interned so repeated loading toggles hand Qt the same string object
+_LOADING_TEXT = sys.intern("Loading...")
+
+# qtawesome icon-set prefixes, split by length so detection is two hash
+# lookups instead of a tuple startswith scan
+_QTA_PREFIXES_2 = frozenset({'fa', 'ph', 'ri'})
+_QTA_PREFIXES_3 = frozenset({'mdi', 'msc'})
+
+# ActionButton styling tables - resolved once at import since COLORS and
+# friends are module constants.
+_PADDINGS = {
+    'sm': (8, 16),
+    'md': (10, 18),
+    'lg': (16, 32),
+}
+
+_FONT_SIZES_BY_SIZE = {
+    'sm': FONT_SIZES['xs'],
+    'md': FONT_SIZES['sm'],
+    'lg': FONT_SIZES['md'],
+}
+
+_ICON_COLORS = {
+    'primary': COLORS['text_light'],
+    'secondary': COLORS['text_primary'],
+    'danger': COLORS['text_light'],
+    'success': COLORS['text_light'],
+    'ghost': COLORS['text_secondary'],
+    'view': COLORS['primary'],
+    'download': COLORS['secondary'],
+    'delete': COLORS['danger'],
+}
+
+_VARIANT_STYLES = {
+    'primary': {
+        'bg': COLORS['primary'],
+        'bg_hover': COLORS['primary_dark'],
+        'color': COLORS['text_light'],
+        'border': 'none',
+    },
+    'secondary': {
+        'bg': COLORS['bg_secondary'],
+        'bg_hover': COLORS['gray_200'],
+        'color': COLORS['text_primary'],
+        'border': f"1px solid {COLORS['border']}",
+    },
+    'danger': {
+        'bg': COLORS['danger'],
+        'bg_hover': COLORS['danger_light'],
+        'color': COLORS['text_light'],
+        'border': 'none',
+    },
+    'success': {
+        'bg': COLORS['success'],
+        'bg_hover': COLORS['success_light'],
+        'color': COLORS['text_light'],
+        'border': 'none',
+    },
+    'ghost': {
+        'bg': 'transparent',
+        'bg_hover': COLORS['bg_secondary'],
+        'color': COLORS['text_secondary'],
+        'border': 'none',
+    },
+    # History page action buttons
+    'view': {
+        'bg': 'rgba(30, 64, 175, 0.04)',
+        'bg_hover': COLORS['primary'],
+        'color': COLORS['primary'],
+        'color_hover': COLORS['text_light'],
+        'border': "2px solid rgba(30, 64, 175, 0.3)",
+        'border_hover': COLORS['primary'],
+    },
+    'download': {
+        'bg': 'rgba(5, 150, 105, 0.04)',
+        'bg_hover': COLORS['secondary'],
+        'color': COLORS['secondary'],
+        'color_hover': COLORS['text_light'],
+        'border': "2px solid rgba(5, 150, 105, 0.3)",
+        'border_hover': COLORS['secondary'],
+    },
+    'delete': {
+        'bg': 'rgba(239, 68, 68, 0.04)',
+        'bg_hover': COLORS['danger'],
+        'color': COLORS['danger'],
+        'color_hover': COLORS['text_light'],
+        'border': "2px solid rgba(239, 68, 68, 0.3)",
+        'border_hover': COLORS['danger'],
+    },
+}
+
+# Action variants (view/download/delete) invert their colors on hover; the
+# others only darken the background. One str.format template per shape.
+_ACTION_VARIANTS = frozenset({'view', 'download', 'delete'})
+
+_STANDARD_TEMPLATE = """
+    QPushButton {{
+        background: {bg};
+        color: {color};
+        border: {border};
+        border-radius: {radius}px;
+        padding: {padding_v}px {padding_h}px;
+        font-size: {font_size}px;
+        font-weight: {weight};
+    }}
+    QPushButton:hover {{
+        background: {bg_hover};
+    }}
+    QPushButton:pressed {{
+        background: {bg_hover};
+    }}
+    QPushButton:disabled {{
+        opacity: 0.5;
+    }}
+"""
+
+_ACTION_TEMPLATE = """
+    QPushButton {{
+        background: {bg};
+        color: {color};
+        border: {border};
+        border-radius: {radius}px;
+        padding: {padding_v}px {padding_h}px;
+        font-size: {font_size}px;
+        font-weight: {weight};
+    }}
+    QPushButton:hover {{
+        background: {bg_hover};
+        color: {color_hover};
+        border: 2px solid {border_hover};
+    }}
+    QPushButton:pressed {{
+        background: {bg_hover};
+    }}
+    QPushButton:disabled {{
+        opacity: 0.5;
+        background: {bg};
+    }}
+"""
+
+# Container-scoped sheets parsed once per group widget: child buttons are
+# styled through dynamic-property selectors, so selection changes only
+# toggle a property and repolish instead of handing Qt a new stylesheet.
+_TOGGLE_GROUP_QSS = f"""
+    ToggleButtonGroup {{
+        background: {COLORS['bg_card']};
+        border: 1px solid {COLORS['border']};
+        border-radius: 10px;
+    }}
+    QPushButton {{
+        background: transparent;
+        color: {COLORS['text_secondary']};
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-size: 14px;
+        font-weight: {FONT_WEIGHTS['medium']};
+    }}
+    QPushButton:checked {{
+        background: {COLORS['primary']};
+        color: {COLORS['text_light']};
+    }}
+    QPushButton:!checked:hover {{
+        color: {COLORS['text_primary']};
+    }}
+"""
+
+_TAB_BAR_QSS = f"""
+    TabBar {{
+        background: {COLORS['bg_card']};
+        border: 1px solid {COLORS['gray_100']};
+        border-radius: {BORDER_RADIUS['xl']}px;
+    }}
+    TabButton {{
+        background: transparent;
+        color: {COLORS['gray_500']};
+        border: none;
+        border-radius: {BORDER_RADIUS['lg']}px;
+        padding: {SPACING['md']}px {SPACING['lg']}px;
+        font-size: {FONT_SIZES['md']}px;
+        font-weight: {FONT_WEIGHTS['semibold']};
+    }}
+    TabButton:checked {{
+        background: {COLORS['primary']};
+        color: {COLORS['text_light']};
+    }}
+    TabButton:!checked:hover {{
+        background: {COLORS['gray_50']};
+        color: {COLORS['gray_700']};
+    }}
+"""
+
 
 class ActionButton(QPushButton):
     """
@@ -41,7 +250,7 @@ class ActionButton(QPushButton):
         size: Size variant ('sm', 'md', 'lg').
         parent: Optional parent widget.
     """
-    
+
     def __init__(
         self,
         text: str,
@@ -55,20 +264,29 @@ class ActionButton(QPushButton):
         self.variant = variant
         self.size = size
         self._icon_name = icon
-        
+        self._styled = False
+        self._saved_text: Optional[str] = None
+
         self._setup_button(text, icon)
-        self._apply_style()
+
+    def showEvent(self, event) -> None:
+        """Apply styling lazily on first show."""
+        if not self._styled:
+            self._apply_style()
+            self._styled = True
+        super().showEvent(event)
     
     def _setup_button(self, text: str, icon: Optional[str]) -> None:
         """Setup button text and icon."""
-        self.setCursor(QCursor(Qt.PointingHandCursor))
+        self.setCursor(_POINTING_CURSOR)
         
         if icon:
             # Check if it's a qtawesome icon name (starts with fa, mdi, ph, ri, msc)
-            is_qta_icon = HAS_QTAWESOME and icon.startswith(('fa', 'mdi', 'ph', 'ri', 'msc'))
+            is_qta_icon = HAS_QTAWESOME and (
+                icon[:2] in _QTA_PREFIXES_2 or icon[:3] in _QTA_PREFIXES_3
+            )
             if is_qta_icon:
-                color = self._get_icon_color()
-                self.setIcon(qta.icon(icon, color=color))
+                self.setIcon(_qta_icon(icon, self._get_icon_color()))
                 self.setText(text)
             else:
                 # Use icon as text prefix (emoji or unicode)
@@ -81,152 +299,53 @@ class ActionButton(QPushButton):
     
     def _get_icon_color(self) -> str:
         """Get icon color based on variant."""
-        icon_colors = {
-            'primary': COLORS['text_light'],
-            'secondary': COLORS['text_primary'],
-            'danger': COLORS['text_light'],
-            'success': COLORS['text_light'],
-            'ghost': COLORS['text_secondary'],
-            'view': COLORS['primary'],
-            'download': COLORS['secondary'],
-            'delete': COLORS['danger'],
-        }
-        return icon_colors.get(self.variant, COLORS['text_light'])
+        return _ICON_COLORS.get(self.variant, COLORS['text_light'])
     
     def _apply_style(self) -> None:
-        """Apply stylesheet based on variant and size."""
-        # Base padding by size
-        paddings = {
-            'sm': (8, 16),
-            'md': (10, 18),
-            'lg': (16, 32),
-        }
-        padding = paddings.get(self.size, paddings['md'])
-        
-        # Font size by size
-        font_sizes = {
-            'sm': FONT_SIZES['xs'],
-            'md': FONT_SIZES['sm'],
-            'lg': FONT_SIZES['md'],
-        }
-        font_size = font_sizes.get(self.size, FONT_SIZES['sm'])
-        
-        # Variant-specific styles
-        variant_styles = {
-            'primary': {
-                'bg': COLORS['primary'],
-                'bg_hover': COLORS['primary_dark'],
-                'color': COLORS['text_light'],
-                'border': 'none',
-            },
-            'secondary': {
-                'bg': COLORS['bg_secondary'],
-                'bg_hover': COLORS['gray_200'],
-                'color': COLORS['text_primary'],
-                'border': f"1px solid {COLORS['border']}",
-            },
-            'danger': {
-                'bg': COLORS['danger'],
-                'bg_hover': COLORS['danger_light'],
-                'color': COLORS['text_light'],
-                'border': 'none',
-            },
-            'success': {
-                'bg': COLORS['success'],
-                'bg_hover': COLORS['success_light'],
-                'color': COLORS['text_light'],
-                'border': 'none',
-            },
-            'ghost': {
-                'bg': 'transparent',
-                'bg_hover': COLORS['bg_secondary'],
-                'color': COLORS['text_secondary'],
-                'border': 'none',
-            },
-            # History page action buttons
-            'view': {
-                'bg': 'rgba(30, 64, 175, 0.04)',
-                'bg_hover': COLORS['primary'],
-                'color': COLORS['primary'],
-                'color_hover': COLORS['text_light'],
-                'border': f"2px solid rgba(30, 64, 175, 0.3)",
-                'border_hover': COLORS['primary'],
-            },
-            'download': {
-                'bg': 'rgba(5, 150, 105, 0.04)',
-                'bg_hover': COLORS['secondary'],
-                'color': COLORS['secondary'],
-                'color_hover': COLORS['text_light'],
-                'border': f"2px solid rgba(5, 150, 105, 0.3)",
-                'border_hover': COLORS['secondary'],
-            },
-            'delete': {
-                'bg': 'rgba(239, 68, 68, 0.04)',
-                'bg_hover': COLORS['danger'],
-                'color': COLORS['danger'],
-                'color_hover': COLORS['text_light'],
-                'border': f"2px solid rgba(239, 68, 68, 0.3)",
-                'border_hover': COLORS['danger'],
-            },
-        }
-        
-        style = variant_styles.get(self.variant, variant_styles['primary'])
-        
-        # Handle action button variants with color change on hover
-        if self.variant in ['view', 'download', 'delete']:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background: {style['bg']};
-                    color: {style['color']};
-                    border: {style['border']};
-                    border-radius: {BORDER_RADIUS['md']}px;
-                    padding: {padding[0]}px {padding[1]}px;
-                    font-size: {font_size}px;
-                    font-weight: {FONT_WEIGHTS['semibold']};
-                }}
-                QPushButton:hover {{
-                    background: {style['bg_hover']};
-                    color: {style.get('color_hover', style['color'])};
-                    border: 2px solid {style.get('border_hover', style['bg_hover'])};
-                }}
-                QPushButton:pressed {{
-                    background: {style['bg_hover']};
-                }}
-                QPushButton:disabled {{
-                    opacity: 0.5;
-                    background: {style['bg']};
-                }}
-            """)
+        """Apply the (cached) stylesheet for this variant and size."""
+        key = (self.variant, self.size)
+        stylesheet = _STYLE_CACHE.get(key)
+        if stylesheet is None:
+            # Interned so Qt's identical-stylesheet comparison is a
+            # pointer check for every button sharing this key.
+            stylesheet = _STYLE_CACHE.setdefault(key, sys.intern(self._build_stylesheet()))
+        self.setStyleSheet(stylesheet)
+
+    def _build_stylesheet(self) -> str:
+        """Build the stylesheet string for this variant and size."""
+        padding = _PADDINGS.get(self.size, _PADDINGS['md'])
+        font_size = _FONT_SIZES_BY_SIZE.get(self.size, FONT_SIZES['sm'])
+        style = _VARIANT_STYLES.get(self.variant, _VARIANT_STYLES['primary'])
+
+        # Action button variants change color on hover and use the heavier
+        # template; everything else shares the standard one.
+        if self.variant in _ACTION_VARIANTS:
+            template = _ACTION_TEMPLATE
+            weight = FONT_WEIGHTS['semibold']
         else:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background: {style['bg']};
-                    color: {style['color']};
-                    border: {style['border']};
-                    border-radius: {BORDER_RADIUS['md']}px;
-                    padding: {padding[0]}px {padding[1]}px;
-                    font-size: {font_size}px;
-                    font-weight: {FONT_WEIGHTS['medium']};
-                }}
-                QPushButton:hover {{
-                    background: {style['bg_hover']};
-                }}
-                QPushButton:pressed {{
-                    background: {style['bg_hover']};
-                }}
-                QPushButton:disabled {{
-                    opacity: 0.5;
-                }}
-            """)
+            template = _STANDARD_TEMPLATE
+            weight = FONT_WEIGHTS['medium']
+
+        return template.format(
+            **style,
+            radius=BORDER_RADIUS['md'],
+            padding_v=padding[0],
+            padding_h=padding[1],
+            font_size=font_size,
+            weight=weight,
+        )
     
     def set_loading(self, loading: bool) -> None:
-        """Set loading state with spinner indicator."""
-        self.setDisabled(loading)
+        """Set loading state, preserving and restoring the original text."""
         if loading:
-            self.setText("Loading...")
+            self._saved_text = self.text()
+            self.setText(_LOADING_TEXT)
+            self.setDisabled(True)
         else:
-            # Restore original text - caller should handle this
-            pass
+            if self._saved_text is not None:
+                self.setText(self._saved_text)
+                self._saved_text = None
+            self.setDisabled(False)
 
 
 class ToggleButtonGroup(QWidget):
@@ -242,7 +361,7 @@ class ToggleButtonGroup(QWidget):
         options: List of (label, icon) tuples for each button.
         parent: Optional parent widget.
     """
-    
+
     selection_changed = pyqtSignal(int)
     
     def __init__(
@@ -255,86 +374,85 @@ class ToggleButtonGroup(QWidget):
         self.options = options
         self.buttons: List[QPushButton] = []
         self.selected_index = 0
-        
+        self._styled = False
+
         self._setup_ui()
+
+    def showEvent(self, event) -> None:
+        """Apply the initial selection styling lazily on first show."""
+        if not self._styled:
+            self._update_button_styles()
+            self._styled = True
+        super().showEvent(event)
     
     def _setup_ui(self) -> None:
         """Setup the toggle button group UI."""
-        self.setStyleSheet(f"""
-            QWidget {{
-                background: {COLORS['bg_card']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 10px;
-            }}
-        """)
-        
+        self.setStyleSheet(_TOGGLE_GROUP_QSS)
+
+        # Exclusive selection is handled natively by QButtonGroup and the
+        # :checked pseudo-state - no stylesheet swaps on the click path.
+        self._group = QButtonGroup(self)
+        self._group.setExclusive(True)
+
         layout = QHBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
         layout.setSpacing(0)
-        
-        for i, (label, icon) in enumerate(self.options):
-            btn = QPushButton(label)
-            btn.setCursor(QCursor(Qt.PointingHandCursor))
-            btn.clicked.connect(lambda checked, idx=i: self._on_button_clicked(idx))
-            
-            # Add icon if available
-            if HAS_QTAWESOME and icon:
-                btn.setIcon(qta.icon('fa5s.layer-group' if i == 0 else 'fa5s.database'))
-            
-            self.buttons.append(btn)
-            layout.addWidget(btn)
-        
-        self._update_button_styles()
-    
+
+        # Suppress intermediate repaints while the group is populated
+        self.setUpdatesEnabled(False)
+        try:
+            for i, (label, icon) in enumerate(self.options):
+                btn = QPushButton(label)
+                btn.setCheckable(True)
+                btn.setCursor(_POINTING_CURSOR)
+
+                # Add icon if available
+                if HAS_QTAWESOME and icon:
+                    btn.setIcon(_qta_icon(
+                        'fa5s.layer-group' if i == 0 else 'fa5s.database',
+                        COLORS['text_secondary']
+                    ))
+
+                self._group.addButton(btn, i)
+                self.buttons.append(btn)
+                layout.addWidget(btn)
+
+            if self.buttons:
+                self.buttons[self.selected_index].setChecked(True)
+        finally:
+            self.setUpdatesEnabled(True)
+
+        self._group.idClicked.connect(self._on_button_clicked)
+
     def _on_button_clicked(self, index: int) -> None:
-        """Handle button click."""
+        """Handle button click (check state already updated by the group)."""
         if index != self.selected_index:
+            prev = self.selected_index
             self.selected_index = index
-            self._update_button_styles()
+            self._update_icon(prev, False)
+            self._update_icon(index, True)
             self.selection_changed.emit(index)
-    
+
+    def _update_icon(self, index: int, selected: bool) -> None:
+        """Swap a button's icon to match its selection state."""
+        if HAS_QTAWESOME:
+            icon_name = 'fa5s.layer-group' if index == 0 else 'fa5s.database'
+            icon_color = COLORS['text_light'] if selected else COLORS['text_secondary']
+            self.buttons[index].setIcon(_qta_icon(icon_name, icon_color))
+
     def _update_button_styles(self) -> None:
-        """Update button styles based on selection."""
-        for i, btn in enumerate(self.buttons):
-            # Update icon color based on selection
-            if HAS_QTAWESOME:
-                icon_name = 'fa5s.layer-group' if i == 0 else 'fa5s.database'
-                icon_color = COLORS['text_light'] if i == self.selected_index else COLORS['text_secondary']
-                btn.setIcon(qta.icon(icon_name, color=icon_color))
-            
-            if i == self.selected_index:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background: {COLORS['primary']};
-                        color: {COLORS['text_light']};
-                        border: none;
-                        border-radius: 8px;
-                        padding: 10px 20px;
-                        font-size: 14px;
-                        font-weight: {FONT_WEIGHTS['medium']};
-                    }}
-                """)
-            else:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background: transparent;
-                        color: {COLORS['text_secondary']};
-                        border: none;
-                        border-radius: 8px;
-                        padding: 10px 20px;
-                        font-size: 14px;
-                        font-weight: {FONT_WEIGHTS['medium']};
-                    }}
-                    QPushButton:hover {{
-                        color: {COLORS['text_primary']};
-                    }}
-                """)
-    
+        """Full icon pass - used for the initial render only."""
+        for i in range(len(self.buttons)):
+            self._update_icon(i, i == self.selected_index)
+
     def set_selection(self, index: int) -> None:
         """Programmatically set the selected button."""
-        if 0 <= index < len(self.buttons):
+        if 0 <= index < len(self.buttons) and index != self.selected_index:
+            prev = self.selected_index
             self.selected_index = index
-            self._update_button_styles()
+            self.buttons[index].setChecked(True)
+            self._update_icon(prev, False)
+            self._update_icon(index, True)
 
 
 class TabButton(QPushButton):
@@ -346,7 +464,7 @@ class TabButton(QPushButton):
         active: Whether this tab is active.
         parent: Optional parent widget.
     """
-    
+
     def __init__(
         self,
         text: str,
@@ -355,106 +473,96 @@ class TabButton(QPushButton):
     ) -> None:
         super().__init__(text, parent)
         self.active = active
-        self.setCursor(QCursor(Qt.PointingHandCursor))
-        self._apply_style()
-    
+        self.setCheckable(True)
+        self.setChecked(active)
+        self.setCursor(_POINTING_CURSOR)
+
     def set_active(self, active: bool) -> None:
-        """Set active state and update styling."""
+        """Set active state; the :checked selector restyles natively."""
+        if active == self.active:
+            return
         self.active = active
-        self._apply_style()
-    
-    def _apply_style(self) -> None:
-        """Apply style based on active state."""
-        if self.active:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background: {COLORS['primary']};
-                    color: {COLORS['text_light']};
-                    border: none;
-                    border-radius: {BORDER_RADIUS['lg']}px;
-                    padding: {SPACING['md']}px {SPACING['lg']}px;
-                    font-size: {FONT_SIZES['md']}px;
-                    font-weight: {FONT_WEIGHTS['semibold']};
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background: transparent;
-                    color: {COLORS['gray_500']};
-                    border: none;
-                    border-radius: {BORDER_RADIUS['lg']}px;
-                    padding: {SPACING['md']}px {SPACING['lg']}px;
-                    font-size: {FONT_SIZES['md']}px;
-                    font-weight: {FONT_WEIGHTS['semibold']};
-                }}
-                QPushButton:hover {{
-                    background: {COLORS['gray_50']};
-                    color: {COLORS['gray_700']};
-                }}
-            """)
+        self.setChecked(active)
+
+
+class TabSpec(NamedTuple):
+    """Tab definition for TabBar - attribute access beats dict lookups."""
+    id: str
+    label: str
 
 
 class TabBar(QWidget):
     """
     Tab bar container matching Analysis page tabs.
-    
+
     Signals:
         tab_changed: Emitted with tab id when tab changes.
-    
+
     Args:
-        tabs: List of tab dictionaries with 'id' and 'label'.
+        tabs: Sequence of TabSpec entries (plain dicts with 'id' and
+            'label' keys are accepted and converted).
         parent: Optional parent widget.
     """
-    
+
     tab_changed = pyqtSignal(str)
-    
+
     def __init__(
         self,
-        tabs: List[dict],
+        tabs: Sequence[TabSpec],
         parent: Optional[QWidget] = None
     ) -> None:
         super().__init__(parent)
-        
-        self.tabs = tabs
+
+        if tabs and isinstance(tabs[0], dict):
+            tabs = [TabSpec(t['id'], t['label']) for t in tabs]
+        self.tabs = tuple(tabs)
         self.buttons: dict = {}
-        self.active_tab = tabs[0]['id'] if tabs else None
-        
+        self.active_tab = self.tabs[0].id if self.tabs else None
+
         self._setup_ui()
     
     def _setup_ui(self) -> None:
         """Setup tab bar UI matching web .tabs styling."""
-        self.setStyleSheet(f"""
-            QWidget {{
-                background: {COLORS['bg_card']};
-                border: 1px solid {COLORS['gray_100']};
-                border-radius: {BORDER_RADIUS['xl']}px;
-            }}
-        """)
-        
+        self.setStyleSheet(_TAB_BAR_QSS)
+
+        # Exclusive checking handled by QButtonGroup; group ids are indexes
+        # into self.tabs and map back to string tab ids.
+        self._group = QButtonGroup(self)
+        self._group.setExclusive(True)
+        self._tab_ids: List[str] = []
+
         layout = QHBoxLayout(self)
         layout.setContentsMargins(SPACING['sm'], SPACING['sm'], SPACING['sm'], SPACING['sm'])
         layout.setSpacing(SPACING['xs'])
-        
-        for tab in self.tabs:
-            btn = TabButton(tab['label'], active=(tab['id'] == self.active_tab))
-            btn.clicked.connect(lambda checked, tid=tab['id']: self._on_tab_clicked(tid))
-            self.buttons[tab['id']] = btn
-            layout.addWidget(btn, 1)  # Equal stretch
-    
+
+        # Suppress intermediate repaints while the bar is populated
+        self.setUpdatesEnabled(False)
+        try:
+            for i, tab in enumerate(self.tabs):
+                btn = TabButton(tab.label, active=(tab.id == self.active_tab))
+                self._group.addButton(btn, i)
+                self._tab_ids.append(tab.id)
+                self.buttons[tab.id] = btn
+                layout.addWidget(btn, 1)  # Equal stretch
+        finally:
+            self.setUpdatesEnabled(True)
+
+        self._group.idClicked.connect(self._on_tab_index_clicked)
+
+    def _on_tab_index_clicked(self, index: int) -> None:
+        """Translate the group's integer id back to a tab id."""
+        self._on_tab_clicked(self._tab_ids[index])
+
     def _on_tab_clicked(self, tab_id: str) -> None:
         """Handle tab click."""
         if tab_id != self.active_tab:
-            # Deactivate previous
-            if self.active_tab and self.active_tab in self.buttons:
-                self.buttons[self.active_tab].set_active(False)
-            
-            # Activate new
+            prev = self.active_tab
             self.active_tab = tab_id
+            if prev in self.buttons:
+                self.buttons[prev].active = False  # group unchecks natively
             self.buttons[tab_id].set_active(True)
-            
             self.tab_changed.emit(tab_id)
-    
+
     def set_active_tab(self, tab_id: str) -> None:
         """Programmatically set active tab."""
         if tab_id in self.buttons:
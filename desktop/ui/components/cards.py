@@ -10,14 +10,18 @@ Version: 2.0.0
 
 from __future__ import annotations
 
-from typing import Optional, Any
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple
 
 from PyQt5.QtWidgets import (
     QWidget, QFrame, QVBoxLayout, QHBoxLayout, QLabel,
     QSizePolicy, QGridLayout
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QRect, QRectF
+from PyQt5.QtGui import (
+    QColor, QFont, QFontMetrics, QPainter, QPen, QPixmap, QPixmapCache
+)
 
 try:
     import qtawesome as qta
@@ -25,24 +29,266 @@ try:
 except ImportError:
     HAS_QTAWESOME = False
 
+if HAS_QTAWESOME:
+    @lru_cache(maxsize=64)
+    def _qta_icon(name: str, color: str):
+        """Shared QIcon cache - qta.icon rasterizes a font glyph per call."""
+        return qta.icon(name, color=color)
+
+    def _icon_pixmap(icon_name: str, color: str, size: int) -> QPixmap:
+        """
+        Rasterized qta glyph shared through QPixmapCache.
+
+        QIcon.pixmap() re-renders on every call even for a cached QIcon;
+        keying the finished pixmap on (name, color, size) makes repeated
+        rows (e.g. DatasetCards in the history list) a straight cache hit.
+        """
+        key = f"{icon_name}|{color}|{size}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = _qta_icon(icon_name, color).pixmap(size, size)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
 from ui.theme import COLORS, FONT_SIZES, FONT_WEIGHTS, BORDER_RADIUS, SPACING, get_icon_style
 from ui.components.constants import LAYOUT
 
 
-class StatCard(QFrame):
+# =============================================================================
+# Precomputed stylesheets
+#
+# Every card of a given class uses identical QSS, so the f-string substitution
+# happens once at import instead of per instance. Passing the same string
+# object to setStyleSheet also lets Qt reuse its parsed stylesheet.
+# =============================================================================
+
+def _card_qss(bg: str, border: str, radius: str) -> str:
+    """Card frame QSS. Hover variants are separate strings swapped from
+    enterEvent/leaveEvent rather than a :hover block, so the style engine
+    never has to track hover state over every card in a grid."""
+    return f"""
+    QFrame {{
+        background: {bg};
+        border: 1px solid {border};
+        border-radius: {radius};
+    }}
+"""
+
+
+# Shared by every inner container; one string object means Qt parses it once
+_TRANSPARENT_QSS = "background: transparent; border: none;"
+
+_CHART_CARD_QSS = _card_qss(COLORS['bg_card'], COLORS['border'], f"{BORDER_RADIUS['lg']}px")
+
+_SUMMARY_CARD_QSS = _card_qss(COLORS['bg_card'], COLORS['border'], '12px')
+_SUMMARY_CARD_HOVER_QSS = _card_qss(COLORS['bg_card'], COLORS['gray_300'], '12px')
+
+_DATASET_CARD_QSS = _card_qss(COLORS['bg_card'], COLORS['gray_100'], f"{BORDER_RADIUS['lg']}px")
+_DATASET_CARD_HOVER_QSS = _card_qss(COLORS['bg_card'], COLORS['gray_200'], f"{BORDER_RADIUS['lg']}px")
+
+
+_DATASET_ICON_QSS = f"""
+    background: {COLORS['primary_bg']};
+    border-radius: {BORDER_RADIUS['md']}px;
+    border: none;
+"""
+
+# Label stylesheets carry only what QFont cannot: colors, borders, padding.
+# Font size/weight go through shared QFont objects (below) so Qt's CSS engine
+# never has to parse font properties per label.
+_CHART_TITLE_QSS = f"""
+    color: {COLORS['text_primary']};
+    background: transparent;
+    border: none;
+    padding-bottom: 8px;
+    border-bottom: 1px solid {COLORS['border']};
+"""
+
+_SUMMARY_TITLE_QSS = f"""
+    color: {COLORS['text_primary']};
+    background: transparent;
+    border: none;
+    padding-bottom: 12px;
+    border-bottom: 1px solid {COLORS['border']};
+"""
+
+_ROW_LABEL_QSS = f"""
+    color: {COLORS['text_secondary']};
+    background: transparent;
+    border: none;
+"""
+
+_ROW_VALUE_QSS = f"""
+    color: {COLORS['text_primary']};
+    background: transparent;
+    border: none;
+"""
+
+_DATASET_NAME_QSS = f"""
+    color: {COLORS['gray_900']};
+    background: transparent;
+    border: none;
+"""
+
+_DATASET_META_QSS = f"""
+    color: {COLORS['gray_500']};
+    background: transparent;
+    border: none;
+"""
+
+
+
+class _HoverBorderMixin:
+    """Swap between two precomputed card stylesheets on pointer enter/leave."""
+
+    _qss_normal = ""
+    _qss_hover = ""
+
+    def enterEvent(self, event) -> None:
+        self.setStyleSheet(self._qss_hover)
+        super().enterEvent(event)
+
+    def leaveEvent(self, event) -> None:
+        self.setStyleSheet(self._qss_normal)
+        super().leaveEvent(event)
+
+
+# =============================================================================
+# StatCard paint resources
+#
+# StatCard draws itself with QPainter instead of composing child widgets, so
+# its fonts, pens, and the 48x48 icon tile are prebuilt and shared.
+# =============================================================================
+
+_STAT_ICON_NAMES = {
+    'database': 'fa5s.database',
+    'activity': 'fa5s.chart-line',
+    'trending': 'fa5s.chart-line',
+    'upload': 'fa5s.upload',
+    'flowrate': 'fa5s.tint',
+    'pressure': 'fa5s.tachometer-alt',
+    'temperature': 'fa5s.thermometer-half',
+    'thermometer': 'fa5s.thermometer-half',
+    'droplet': 'fa5s.tint',
+}
+
+_STAT_ICON_EMOJI = {
+    'database': '📊',
+    'activity': '📈',
+    'trending': '📈',
+    'upload': '⬆️',
+    'flowrate': '💧',
+    'pressure': '🔧',
+    'temperature': '🌡️',
+}
+
+# Resolved once for the small fixed set of icon types
+_ICON_STYLES = {
+    icon_type: get_icon_style(icon_type) for icon_type in _STAT_ICON_NAMES
+}
+_DEFAULT_ICON_STYLE = _ICON_STYLES['database']
+
+
+def _make_font(pixel_size: int, weight: int) -> QFont:
+    """Build a shared QFont - cheaper than per-label font-size QSS parsing."""
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setWeight(weight)
+    return font
+
+
+_FONT_STAT_LABEL = _make_font(FONT_SIZES['sm'], QFont.Medium)
+_STAT_VALUE_FONTS = {size: _make_font(size, QFont.Bold) for size in (14, 18, 28)}
+_FONT_STAT_VALUE_SMALL = _make_font(14, QFont.DemiBold)
+
+# Shared label fonts for the remaining label-based cards
+_FONT_LG_SEMIBOLD = _make_font(FONT_SIZES['lg'], QFont.DemiBold)
+_FONT_LG_BOLD = _make_font(FONT_SIZES['lg'], QFont.Bold)
+_FONT_XL_SEMIBOLD = _make_font(FONT_SIZES['xl'], QFont.DemiBold)
+_FONT_MD_SEMIBOLD = _make_font(FONT_SIZES['md'], QFont.DemiBold)
+_FONT_SM = _make_font(FONT_SIZES['sm'], QFont.Normal)
+_FONT_SM_MEDIUM = _make_font(FONT_SIZES['sm'], QFont.Medium)
+_FONT_XS = _make_font(FONT_SIZES['xs'], QFont.Normal)
+
+_COLOR_CARD_BG = QColor(COLORS['bg_card'])
+_COLOR_CARD_BORDER = QColor(COLORS['border'])
+_COLOR_CARD_BORDER_HOVER = QColor(COLORS['gray_300'])
+_COLOR_TEXT_PRIMARY = QColor(COLORS['text_primary'])
+_COLOR_TEXT_SECONDARY = QColor(COLORS['text_secondary'])
+
+# DistributionItem paints its three text lines the same way
+_COLOR_DIST_BG = QColor(COLORS['gray_50'])
+_COLOR_DIST_BORDER = QColor(COLORS['gray_100'])
+_COLOR_DIST_BORDER_HOVER = QColor(COLORS['gray_200'])
+_COLOR_DIST_TYPE = QColor(COLORS['gray_700'])
+_COLOR_DIST_COUNT = QColor(COLORS['primary'])
+_COLOR_DIST_PERCENT = QColor(COLORS['gray_500'])
+
+
+def _css_rgba(value: str) -> QColor:
+    """Convert a theme 'rgba(r, g, b, a)' string to QColor (QColor only parses hex)."""
+    if value.startswith('rgba('):
+        r, g, b, a = (float(part) for part in value[5:-1].split(','))
+        return QColor(int(r), int(g), int(b), int(round(a * 255)))
+    return QColor(value)
+
+
+@lru_cache(maxsize=16)
+def _stat_icon_pixmap(icon_type: str) -> QPixmap:
+    """
+    Pre-render the 48x48 rounded icon tile for a stat type.
+
+    Cached per type so a grid of StatCards rasterizes each tile once.
+    Must only be called after the QApplication exists (i.e. from __init__).
+    """
+    icon_style = _ICON_STYLES.get(icon_type, _DEFAULT_ICON_STYLE)
+    size = LAYOUT['stat_icon_size']
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(_css_rgba(icon_style['bg']))
+    painter.drawRoundedRect(pixmap.rect(), BORDER_RADIUS['xl'], BORDER_RADIUS['xl'])
+
+    if HAS_QTAWESOME:
+        icon_name = _STAT_ICON_NAMES.get(icon_type, 'fa5s.chart-bar')
+        glyph_rect = QRect((size - 22) // 2, (size - 22) // 2, 22, 22)
+        painter.drawPixmap(glyph_rect, _icon_pixmap(icon_name, icon_style['fg'], 22))
+    else:
+        # Fallback to emoji
+        painter.setPen(QColor(icon_style['fg']))
+        painter.setFont(_make_font(20, QFont.Normal))
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, _STAT_ICON_EMOJI.get(icon_type, '📊'))
+
+    painter.end()
+    return pixmap
+
+
+class StatCard(QWidget):
     """
     Statistics card matching web UI .stat-card styling.
-    
-    Displays a metric with an icon, label, and value.
+
+    Displays a metric with an icon, label, and value. The card paints its
+    rounded background, icon tile, and both text lines directly in
+    paintEvent - the previous frame/layout/label tree cost ~8 widgets per
+    card, which added up across a 4-column dashboard grid.
+
     Height: 86px, Icon: 48x48px, 4-column grid with 20px gap.
-    
+
     Args:
         label: Metric label (e.g., "Total Datasets").
         value: Metric value (e.g., "15" or "123.45").
         icon: Icon type for background color (database, activity, trending, upload).
         parent: Optional parent widget.
     """
-    
+
+    # Geometry matching the old layout: padding 18px 20px, gap 14px
+    _PADDING_H = 20
+    _PADDING_V = 18
+    _ICON_GAP = 14
+
     def __init__(
         self,
         label: str,
@@ -51,248 +297,220 @@ class StatCard(QFrame):
         parent: Optional[QWidget] = None
     ) -> None:
         super().__init__(parent)
-        
+
         self.label_text = label
         self.value_text = value
         self.icon_type = icon
-        
-        self._setup_ui()
-    
-    def _setup_ui(self) -> None:
-        """Setup the stat card UI."""
-        # Card styling - matching .stat-card
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: {COLORS['bg_card']};
-                border: 1px solid {COLORS['border']};
-                border-radius: {BORDER_RADIUS['xl']}px;
-            }}
-            QFrame:hover {{
-                border-color: {COLORS['gray_300']};
-            }}
-        """)
-        
+
+        self._value_font = _STAT_VALUE_FONTS[28]
+        self._icon_pixmap = _stat_icon_pixmap(icon)
+        self._hovered = False
+
         # Fixed height matching web
         self.setFixedHeight(LAYOUT['stat_card_height'])
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(20, 18, 20, 18)  # padding: 18px 20px
-        layout.setSpacing(14)  # gap: 14px
-        
-        # Icon container - 48x48px
-        icon_style = get_icon_style(self.icon_type)
-        icon_container = QFrame()
-        icon_container.setFixedSize(LAYOUT['stat_icon_size'], LAYOUT['stat_icon_size'])
-        icon_container.setStyleSheet(f"""
-            QFrame {{
-                background: {icon_style['bg']};
-                border-radius: {BORDER_RADIUS['xl']}px;
-                border: none;
-            }}
-        """)
-        
-        icon_layout = QHBoxLayout(icon_container)
-        icon_layout.setContentsMargins(0, 0, 0, 0)
-        icon_layout.setAlignment(Qt.AlignCenter)
-        
-        # Icon label (using QtAwesome or emoji fallback)
-        icon_label = QLabel()
-        icon_label.setAlignment(Qt.AlignCenter)
-        
-        if HAS_QTAWESOME:
-            icon_map = {
-                'database': 'fa5s.database',
-                'activity': 'fa5s.chart-line',
-                'trending': 'fa5s.chart-line',
-                'upload': 'fa5s.upload',
-                'flowrate': 'fa5s.tint',
-                'pressure': 'fa5s.tachometer-alt',
-                'temperature': 'fa5s.thermometer-half',
-                'thermometer': 'fa5s.thermometer-half',
-                'droplet': 'fa5s.tint',
-            }
-            icon_name = icon_map.get(self.icon_type, 'fa5s.chart-bar')
-            icon_widget = qta.IconWidget(icon_name, color=icon_style['fg'])
-            icon_widget.setIconSize(22)
-            icon_layout.addWidget(icon_widget)
-        else:
-            # Fallback to emoji
-            emoji_map = {
-                'database': '📊',
-                'activity': '📈',
-                'trending': '📈',
-                'upload': '⬆️',
-                'flowrate': '💧',
-                'pressure': '🔧',
-                'temperature': '🌡️',
-            }
-            icon_label.setText(emoji_map.get(self.icon_type, '📊'))
-            icon_label.setStyleSheet(f"font-size: 20px; color: {icon_style['fg']};")
-            icon_layout.addWidget(icon_label)
-        
-        layout.addWidget(icon_container)
-        
-        # Content container
-        content = QWidget()
-        content.setStyleSheet("background: transparent; border: none;")
-        content_layout = QVBoxLayout(content)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(2)  # gap: 2px
-        
+
+    @classmethod
+    def build_many(
+        cls,
+        specs: Sequence[Tuple[str, str, str]],
+        parent: Optional[QWidget] = None,
+    ) -> List['StatCard']:
+        """
+        Construct a batch of StatCards in one update window.
+
+        Pre-warms the shared icon tiles so each distinct type rasterizes
+        once, and suppresses repaints on the parent while the batch is
+        built instead of paying one invalidation per card.
+
+        Args:
+            specs: (label, value, icon) tuples, one per card.
+            parent: Optional parent widget for the whole batch.
+
+        Returns:
+            The cards in spec order.
+        """
+        if parent is not None:
+            parent.setUpdatesEnabled(False)
+        try:
+            for _, _, icon in specs:
+                _stat_icon_pixmap(icon)
+            return [cls(label, value, icon, parent) for label, value, icon in specs]
+        finally:
+            if parent is not None:
+                parent.setUpdatesEnabled(True)
+
+    def paintEvent(self, event) -> None:
+        """Draw background, icon tile, label, and value in one pass."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Card background - matching .stat-card (border brightens on hover)
+        border = _COLOR_CARD_BORDER_HOVER if self._hovered else _COLOR_CARD_BORDER
+        painter.setPen(QPen(border))
+        painter.setBrush(_COLOR_CARD_BG)
+        radius = BORDER_RADIUS['xl']
+        painter.drawRoundedRect(
+            QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), radius, radius
+        )
+
+        # Icon tile - 48x48px, vertically centered
+        icon_size = LAYOUT['stat_icon_size']
+        painter.drawPixmap(
+            self._PADDING_H, (self.height() - icon_size) // 2, self._icon_pixmap
+        )
+
+        text_x = self._PADDING_H + icon_size + self._ICON_GAP
+        text_width = self.width() - text_x - self._PADDING_H
+
         # Label - 13px, font-weight 500
-        self.label_widget = QLabel(self.label_text)
-        self.label_widget.setStyleSheet(f"""
-            color: {COLORS['text_secondary']};
-            font-size: {FONT_SIZES['sm']}px;
-            font-weight: {FONT_WEIGHTS['medium']};
-            background: transparent;
-            border: none;
-        """)
-        content_layout.addWidget(self.label_widget)
-        
-        # Value - 28px, font-weight 700
-        self.value_widget = QLabel(self.value_text)
-        self.value_widget.setStyleSheet(f"""
-            color: {COLORS['text_primary']};
-            font-size: 28px;
-            font-weight: {FONT_WEIGHTS['bold']};
-            background: transparent;
-            border: none;
-        """)
-        content_layout.addWidget(self.value_widget)
-        
-        layout.addWidget(content, 1)
-    
+        painter.setFont(_FONT_STAT_LABEL)
+        painter.setPen(_COLOR_TEXT_SECONDARY)
+        label_height = painter.fontMetrics().height()
+        painter.drawText(
+            QRect(text_x, self._PADDING_V, text_width, label_height),
+            Qt.AlignLeft | Qt.AlignVCenter,
+            self.label_text,
+        )
+
+        # Value below the label - gap: 2px
+        value_top = self._PADDING_V + label_height + 2
+        painter.setFont(self._value_font)
+        painter.setPen(_COLOR_TEXT_PRIMARY)
+        painter.drawText(
+            QRect(text_x, value_top, text_width,
+                  self.height() - value_top - self._PADDING_V),
+            Qt.AlignLeft | Qt.AlignVCenter,
+            self.value_text,
+        )
+
+    def enterEvent(self, event) -> None:
+        self._hovered = True
+        self.update()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event) -> None:
+        self._hovered = False
+        self.update()
+        super().leaveEvent(event)
+
     def set_value(self, value: str) -> None:
         """Update the displayed value."""
         self.value_text = value
-        self.value_widget.setText(value)
-    
+        self.update()
+
     def update_value(self, value: Any, small: bool = False) -> None:
         """Update the displayed value (alias for set_value with formatting)."""
         formatted = str(value) if not isinstance(value, str) else value
         self.value_text = formatted
-        
+
         # Auto-adjust font size for long values
         if len(formatted) > 15:
             self._set_font_size(14)
         elif len(formatted) > 10:
             self._set_font_size(18)
         elif small:
-            self.set_small_value(formatted)
-            return
+            self._value_font = _FONT_STAT_VALUE_SMALL
         else:
             self._set_font_size(28)
-        
-        self.value_widget.setText(formatted)
-    
+
+        self.update()
+
     def _set_font_size(self, size: int) -> None:
         """Set the value font size."""
-        self.value_widget.setStyleSheet(f"""
-            color: {COLORS['text_primary']};
-            font-size: {size}px;
-            font-weight: {FONT_WEIGHTS['bold']};
-            background: transparent;
-            border: none;
-        """)
-    
+        self._value_font = _STAT_VALUE_FONTS[size]
+
     def set_label(self, label: str) -> None:
         """Update the displayed label."""
         self.label_text = label
-        self.label_widget.setText(label)
-    
+        self.update()
+
     def set_small_value(self, value: str) -> None:
         """Set a smaller font size for the value (for dates, etc.)."""
-        self.value_widget.setStyleSheet(f"""
-            color: {COLORS['text_primary']};
-            font-size: 14px;
-            font-weight: {FONT_WEIGHTS['semibold']};
-            background: transparent;
-            border: none;
-        """)
-        self.value_widget.setText(value)
+        self._value_font = _FONT_STAT_VALUE_SMALL
+        self.value_text = value
+        self.update()
 
 
 class ChartCard(QFrame):
     """
     Chart container card matching web UI .chart-card styling.
-    
+
     Provides a titled container for chart widgets with consistent styling.
     Height: 400px for charts.
-    
+
     Args:
         title: Chart title.
         parent: Optional parent widget.
     """
-    
+
     def __init__(
         self,
         title: str,
         parent: Optional[QWidget] = None
     ) -> None:
         super().__init__(parent)
-        
+
         self.title_text = title
         self.chart_widget: Optional[QWidget] = None
-        
+
         self._setup_ui()
-    
+
     def _setup_ui(self) -> None:
         """Setup the chart card UI."""
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: {COLORS['bg_card']};
-                border: 1px solid {COLORS['border']};
-                border-radius: {BORDER_RADIUS['lg']}px;
-            }}
-        """)
-        
+        # Size policy first, stylesheet last: the polish pass then sees a
+        # fully-populated tree and geometry settles in one update.
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+            self.setStyleSheet(_CHART_CARD_QSS)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_ui(self) -> None:
+        """Create child widgets."""
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        
+
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(SPACING['lg'], SPACING['lg'], SPACING['lg'], SPACING['lg'])
         self.layout.setSpacing(SPACING['md'])
-        
+
         # Title
         title_label = QLabel(self.title_text)
-        title_label.setStyleSheet(f"""
-            color: {COLORS['text_primary']};
-            font-size: {FONT_SIZES['lg']}px;
-            font-weight: {FONT_WEIGHTS['semibold']};
-            background: transparent;
-            border: none;
-            padding-bottom: 8px;
-            border-bottom: 1px solid {COLORS['border']};
-        """)
+        title_label.setFont(_FONT_LG_SEMIBOLD)
+        title_label.setStyleSheet(_CHART_TITLE_QSS)
         self.layout.addWidget(title_label)
-        
+
         # Chart container placeholder
         self.chart_container = QWidget()
         self.chart_container.setMinimumHeight(LAYOUT['chart_height'])
-        self.chart_container.setStyleSheet("background: transparent; border: none;")
+        self.chart_container.setStyleSheet(_TRANSPARENT_QSS)
         self.chart_container_layout = QVBoxLayout(self.chart_container)
         self.chart_container_layout.setContentsMargins(0, 0, 0, 0)
         self.layout.addWidget(self.chart_container)
-    
+
     def set_chart(self, chart_widget: QWidget) -> None:
         """Set the chart widget to display."""
         # Clear existing
         if self.chart_widget:
             self.chart_container_layout.removeWidget(self.chart_widget)
             self.chart_widget.deleteLater()
-        
+
         self.chart_widget = chart_widget
         self.chart_container_layout.addWidget(chart_widget)
 
 
-class SummaryCard(QFrame):
+class SummaryCard(_HoverBorderMixin, QFrame):
     """
     Summary card matching web UI .summary-card styling.
-    
+
     Displays parameter summary with average and range values.
     Used in Dashboard for Flowrate/Pressure/Temperature summaries.
-    
+
+    The label tree is built on first show; cards on a page that is never
+    brought to the front (and cards updated before being shown) skip the
+    initial placeholder render entirely.
+
     Args:
         title: Parameter name (e.g., "Flowrate").
         average: Average value.
@@ -300,7 +518,10 @@ class SummaryCard(QFrame):
         max_val: Maximum value.
         parent: Optional parent widget.
     """
-    
+
+    _qss_normal = _SUMMARY_CARD_QSS
+    _qss_hover = _SUMMARY_CARD_HOVER_QSS
+
     def __init__(
         self,
         title: str,
@@ -310,262 +531,262 @@ class SummaryCard(QFrame):
         parent: Optional[QWidget] = None
     ) -> None:
         super().__init__(parent)
-        
+
         self.title_text = title
         self.average = average
         self.min_val = min_val
         self.max_val = max_val
-        
-        self._setup_ui()
-    
+
+        # Rows are created lazily in showEvent; set_values before first
+        # show just records the strings for _build_ui to pick up.
+        self._avg_value_label: Optional[QLabel] = None
+        self._range_value_label: Optional[QLabel] = None
+        self._built = False
+
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+    def showEvent(self, event) -> None:
+        """Build the label tree the first time the card becomes visible."""
+        if not self._built:
+            self._built = True
+            self._setup_ui()
+        super().showEvent(event)
+
     def _setup_ui(self) -> None:
         """Setup the summary card UI."""
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: {COLORS['bg_card']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 12px;
-            }}
-            QFrame:hover {{
-                border-color: {COLORS['gray_300']};
-            }}
-        """)
-        
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+            self.setStyleSheet(_SUMMARY_CARD_QSS)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_ui(self) -> None:
+        """Create child widgets."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)  # padding: 24px
         layout.setSpacing(16)
-        
-        # Initialize references BEFORE creating rows
-        self._avg_value_label: Optional[QLabel] = None
-        self._range_value_label: Optional[QLabel] = None
-        
+
         # Title with bottom border
         title_label = QLabel(self.title_text)
-        title_label.setStyleSheet(f"""
-            color: {COLORS['text_primary']};
-            font-size: {FONT_SIZES['lg']}px;
-            font-weight: {FONT_WEIGHTS['bold']};
-            background: transparent;
-            border: none;
-            padding-bottom: 12px;
-            border-bottom: 1px solid {COLORS['border']};
-        """)
+        title_label.setFont(_FONT_LG_BOLD)
+        title_label.setStyleSheet(_SUMMARY_TITLE_QSS)
         layout.addWidget(title_label)
-        
+
         # Stats container
         stats_widget = QWidget()
-        stats_widget.setStyleSheet("background: transparent; border: none;")
+        stats_widget.setStyleSheet(_TRANSPARENT_QSS)
         stats_layout = QVBoxLayout(stats_widget)
         stats_layout.setContentsMargins(0, 0, 0, 0)
         stats_layout.setSpacing(12)
-        
+
         # Average stat
         avg_row = self._create_stat_row("Average", self.average)
         stats_layout.addWidget(avg_row)
-        
+
         # Range stat
         range_val = f"{self.min_val} - {self.max_val}"
         range_row = self._create_stat_row("Range", range_val)
         stats_layout.addWidget(range_row)
-        
+
         layout.addWidget(stats_widget)
-    
+
     def _create_stat_row(self, label: str, value: str) -> QWidget:
         """Create a stat row with label and value."""
         row = QWidget()
-        row.setStyleSheet("background: transparent; border: none;")
-        
+        row.setStyleSheet(_TRANSPARENT_QSS)
+
         row_layout = QHBoxLayout(row)
         row_layout.setContentsMargins(0, 0, 0, 0)
         row_layout.setSpacing(8)
-        
+
         label_widget = QLabel(label)
-        label_widget.setStyleSheet(f"""
-            color: {COLORS['text_secondary']};
-            font-size: {FONT_SIZES['sm']}px;
-            background: transparent;
-            border: none;
-        """)
+        label_widget.setFont(_FONT_SM)
+        label_widget.setStyleSheet(_ROW_LABEL_QSS)
         row_layout.addWidget(label_widget)
-        
+
         row_layout.addStretch()
-        
+
         value_widget = QLabel(value)
-        value_widget.setStyleSheet(f"""
-            color: {COLORS['text_primary']};
-            font-size: {FONT_SIZES['md']}px;
-            font-weight: {FONT_WEIGHTS['semibold']};
-            background: transparent;
-            border: none;
-        """)
+        value_widget.setFont(_FONT_MD_SEMIBOLD)
+        value_widget.setStyleSheet(_ROW_VALUE_QSS)
         row_layout.addWidget(value_widget)
-        
+
         # Store reference
         if label == "Average":
             self._avg_value_label = value_widget
         else:
             self._range_value_label = value_widget
-        
+
         return row
-    
+
     def set_values(self, average: str, min_val: str, max_val: str) -> None:
         """Update all values."""
         self.average = average
         self.min_val = min_val
         self.max_val = max_val
-        
+
+        # Before first show the rows don't exist; _build_ui reads the
+        # attributes above when the card is eventually displayed.
         if self._avg_value_label:
             self._avg_value_label.setText(average)
         if self._range_value_label:
             self._range_value_label.setText(f"{min_val} - {max_val}")
-    
+
     def update_values(self, average: str, min_val: str, max_val: str) -> None:
         """Update all values (alias for set_values)."""
         self.set_values(average, min_val, max_val)
 
 
-class DatasetCard(QFrame):
+@lru_cache(maxsize=1)
+def _dist_item_height() -> int:
+    """Fixed DistributionItem height matching the old three-label layout."""
+    line_heights = sum(
+        QFontMetrics(font).height()
+        for font in (_FONT_SM_MEDIUM, _FONT_XL_SEMIBOLD, _FONT_XS)
+    )
+    return 2 * SPACING['md'] + line_heights + 2 * 4
+
+
+@lru_cache(maxsize=512)
+def _format_uploaded_at(raw: str) -> str:
+    """
+    Format an ISO upload timestamp for display, e.g. 'Jan 05, 2026 at 02:30 PM'.
+
+    Cached because history rows from the same upload batch repeat the
+    same timestamp; non-ISO values pass through unchanged.
+    """
+    if 'T' not in raw:
+        return raw
+    try:
+        return datetime.fromisoformat(raw.replace('Z', '+00:00')).strftime(
+            '%b %d, %Y at %I:%M %p'
+        )
+    except ValueError:
+        return raw
+
+
+class DatasetCard(_HoverBorderMixin, QFrame):
     """
     Dataset card for History page matching web UI .dataset-card styling.
-    
+
     Displays dataset info with View, PDF, and Delete action buttons.
-    
+
     Args:
         dataset: Dataset dictionary with id, name, row_count, uploaded_at.
         parent: Optional parent widget.
     """
-    
+
+    _qss_normal = _DATASET_CARD_QSS
+    _qss_hover = _DATASET_CARD_HOVER_QSS
+
     def __init__(
         self,
         dataset: dict,
         parent: Optional[QWidget] = None
     ) -> None:
         super().__init__(parent)
-        
+
         self.dataset = dataset
         self._setup_ui()
-    
+
     def _setup_ui(self) -> None:
         """Setup the dataset card UI."""
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: {COLORS['bg_card']};
-                border: 1px solid {COLORS['gray_100']};
-                border-radius: {BORDER_RADIUS['lg']}px;
-            }}
-            QFrame:hover {{
-                border-color: {COLORS['gray_200']};
-            }}
-        """)
-        
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+            self.setStyleSheet(_DATASET_CARD_QSS)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_ui(self) -> None:
+        """Create child widgets."""
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        
+
         layout = QHBoxLayout(self)
         layout.setContentsMargins(SPACING['lg'], SPACING['xl'], SPACING['xl'], SPACING['lg'])
         layout.setSpacing(SPACING['lg'])
-        
+
         # Left side - Icon + Details
         info_widget = QWidget()
-        info_widget.setStyleSheet("background: transparent; border: none;")
+        info_widget.setStyleSheet(_TRANSPARENT_QSS)
         info_layout = QHBoxLayout(info_widget)
         info_layout.setContentsMargins(0, 0, 0, 0)
         info_layout.setSpacing(SPACING['lg'])
-        
-        # Icon container - 48x48px
-        icon_container = QFrame()
-        icon_container.setFixedSize(48, 48)
-        icon_container.setStyleSheet(f"""
-            QFrame {{
-                background: {COLORS['primary_bg']};
-                border-radius: {BORDER_RADIUS['md']}px;
-                border: none;
-            }}
-        """)
-        
-        icon_layout = QHBoxLayout(icon_container)
-        icon_layout.setContentsMargins(0, 0, 0, 0)
-        icon_layout.setAlignment(Qt.AlignCenter)
-        
+
+        # Icon tile - 48x48px; a single aligned QLabel stands in for the
+        # old frame + layout wrapper
+        icon_label = QLabel()
+        icon_label.setFixedSize(48, 48)
+        icon_label.setAlignment(Qt.AlignCenter)
+        icon_label.setStyleSheet(_DATASET_ICON_QSS)
         if HAS_QTAWESOME:
-            icon_widget = qta.IconWidget('fa5s.database', color=COLORS['primary'])
-            icon_widget.setIconSize(20)
-            icon_layout.addWidget(icon_widget)
+            icon_label.setPixmap(_icon_pixmap('fa5s.database', COLORS['primary'], 20))
         else:
-            icon_label = QLabel("📊")
-            icon_label.setStyleSheet(f"font-size: 20px; color: {COLORS['primary']};")
-            icon_layout.addWidget(icon_label)
-        
-        info_layout.addWidget(icon_container)
-        
+            icon_label.setText("📊")
+            icon_label.setStyleSheet(
+                _DATASET_ICON_QSS + f"font-size: 20px; color: {COLORS['primary']};"
+            )
+
+        info_layout.addWidget(icon_label)
+
         # Details
         details_widget = QWidget()
-        details_widget.setStyleSheet("background: transparent; border: none;")
+        details_widget.setStyleSheet(_TRANSPARENT_QSS)
         details_layout = QVBoxLayout(details_widget)
         details_layout.setContentsMargins(0, 0, 0, 0)
         details_layout.setSpacing(SPACING['xs'])
-        
+
         # Dataset name
         name_label = QLabel(self.dataset.get('name', 'Unnamed Dataset'))
-        name_label.setStyleSheet(f"""
-            color: {COLORS['gray_900']};
-            font-size: {FONT_SIZES['lg']}px;
-            font-weight: {FONT_WEIGHTS['semibold']};
-            background: transparent;
-            border: none;
-        """)
+        name_label.setFont(_FONT_LG_SEMIBOLD)
+        name_label.setStyleSheet(_DATASET_NAME_QSS)
         details_layout.addWidget(name_label)
-        
+
         # Meta info
         row_count = self.dataset.get('row_count', 0)
         uploaded_at = self.dataset.get('uploaded_at', '')
-        
-        # Format date if needed
         if uploaded_at:
-            try:
-                from datetime import datetime
-                if 'T' in uploaded_at:
-                    dt = datetime.fromisoformat(uploaded_at.replace('Z', '+00:00'))
-                    uploaded_at = dt.strftime('%b %d, %Y at %I:%M %p')
-            except:
-                pass
-        
+            uploaded_at = _format_uploaded_at(uploaded_at)
+
         meta_label = QLabel(f"{row_count} equipment records  •  Uploaded {uploaded_at}")
-        meta_label.setStyleSheet(f"""
-            color: {COLORS['gray_500']};
-            font-size: {FONT_SIZES['sm']}px;
-            background: transparent;
-            border: none;
-        """)
+        meta_label.setFont(_FONT_SM)
+        meta_label.setStyleSheet(_DATASET_META_QSS)
         details_layout.addWidget(meta_label)
-        
+
         info_layout.addWidget(details_widget, 1)
         layout.addWidget(info_widget, 1)
-        
+
         # Actions will be added by parent widget
         self.actions_layout = QHBoxLayout()
         self.actions_layout.setSpacing(SPACING['sm'])
         layout.addLayout(self.actions_layout)
-    
+
     def add_action(self, button: 'ActionButton') -> None:
         """Add an action button to the card."""
         self.actions_layout.addWidget(button)
 
 
-class DistributionItem(QFrame):
+class DistributionItem(QWidget):
     """
     Distribution item card for Analysis page type distribution.
-    
-    Displays equipment type with count and percentage.
-    
+
+    Displays equipment type with count and percentage. Like StatCard, the
+    item draws its background and three text lines in paintEvent instead
+    of stacking styled QLabels - the Analysis grid can hold one item per
+    equipment type, so the per-item widget count matters.
+
     Args:
         type_name: Equipment type name.
         count: Number of equipment of this type.
         total: Total equipment count for percentage calculation.
         parent: Optional parent widget.
     """
-    
+
+    # padding: 16px, gap: 4px (matching the old layout)
+    _PADDING = SPACING['md']
+    _LINE_GAP = 4
+
     def __init__(
         self,
         type_name: str,
@@ -574,60 +795,53 @@ class DistributionItem(QFrame):
         parent: Optional[QWidget] = None
     ) -> None:
         super().__init__(parent)
-        
+
         self.type_name = type_name
         self.count = count
         self.percentage = (count / total * 100) if total > 0 else 0
-        
-        self._setup_ui()
-    
-    def _setup_ui(self) -> None:
-        """Setup the distribution item UI."""
-        self.setStyleSheet(f"""
-            QFrame {{
-                background: {COLORS['gray_50']};
-                border: 1px solid {COLORS['gray_100']};
-                border-radius: {BORDER_RADIUS['md']}px;
-            }}
-            QFrame:hover {{
-                border-color: {COLORS['gray_200']};
-            }}
-        """)
-        
+        self._percent_text = f"{self.percentage:.1f}%"
+        self._hovered = False
+
+        self.setFixedHeight(_dist_item_height())
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(SPACING['md'], SPACING['md'], SPACING['md'], SPACING['md'])
-        layout.setSpacing(4)
-        
-        # Type name
-        type_label = QLabel(self.type_name)
-        type_label.setStyleSheet(f"""
-            color: {COLORS['gray_700']};
-            font-size: {FONT_SIZES['sm']}px;
-            font-weight: {FONT_WEIGHTS['medium']};
-            background: transparent;
-            border: none;
-        """)
-        layout.addWidget(type_label)
-        
-        # Count
-        count_label = QLabel(str(self.count))
-        count_label.setStyleSheet(f"""
-            color: {COLORS['primary']};
-            font-size: {FONT_SIZES['xl']}px;
-            font-weight: {FONT_WEIGHTS['semibold']};
-            background: transparent;
-            border: none;
-        """)
-        layout.addWidget(count_label)
-        
-        # Percentage
-        percent_label = QLabel(f"{self.percentage:.1f}%")
-        percent_label.setStyleSheet(f"""
-            color: {COLORS['gray_500']};
-            font-size: {FONT_SIZES['xs']}px;
-            background: transparent;
-            border: none;
-        """)
-        layout.addWidget(percent_label)
+
+    def paintEvent(self, event) -> None:
+        """Draw background and the type/count/percentage lines in one pass."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        border = _COLOR_DIST_BORDER_HOVER if self._hovered else _COLOR_DIST_BORDER
+        painter.setPen(QPen(border))
+        painter.setBrush(_COLOR_DIST_BG)
+        radius = BORDER_RADIUS['md']
+        painter.drawRoundedRect(
+            QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), radius, radius
+        )
+
+        x = self._PADDING
+        width = self.width() - 2 * self._PADDING
+        y = self._PADDING
+        for font, color, text in (
+            (_FONT_SM_MEDIUM, _COLOR_DIST_TYPE, self.type_name),
+            (_FONT_XL_SEMIBOLD, _COLOR_DIST_COUNT, str(self.count)),
+            (_FONT_XS, _COLOR_DIST_PERCENT, self._percent_text),
+        ):
+            painter.setFont(font)
+            painter.setPen(color)
+            line_height = painter.fontMetrics().height()
+            painter.drawText(
+                QRect(x, y, width, line_height),
+                Qt.AlignLeft | Qt.AlignVCenter,
+                text,
+            )
+            y += line_height + self._LINE_GAP
+
+    def enterEvent(self, event) -> None:
+        self._hovered = True
+        self.update()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event) -> None:
+        self._hovered = False
+        self.update()
+        super().leaveEvent(event)
@@ -184,11 +184,14 @@ class DashboardWidget(QWidget):
         stats_grid = QGridLayout()
         stats_grid.setSpacing(GRID_GAPS['stats'])  # 20px
         
-        # Create stat cards using new component
-        self.total_card = StatCard("Total Datasets", "0", icon="database")
-        self.equip_card = StatCard("Total Equipment", "0", icon="activity")
-        self.flowrate_card = StatCard("Avg Flowrate", "-", icon="trending")
-        self.upload_card = StatCard("Latest Upload", "-", icon="upload")
+        # Create stat cards as one batch (single update window)
+        self.total_card, self.equip_card, self.flowrate_card, self.upload_card = \
+            StatCard.build_many([
+                ("Total Datasets", "0", "database"),
+                ("Total Equipment", "0", "activity"),
+                ("Avg Flowrate", "-", "trending"),
+                ("Latest Upload", "-", "upload"),
+            ], content)
         
         stats_grid.addWidget(self.total_card, 0, 0)
         stats_grid.addWidget(self.equip_card, 0, 1)
@@ -283,7 +286,7 @@ class DashboardWidget(QWidget):
             icon="fa5s.chart-line"
         )
         self.view_analytics_btn.setVisible(False)
-        self.view_analytics_btn.dataset_id = None
+        self._analytics_dataset_id = None
         self.view_analytics_btn.clicked.connect(self._on_view_analytics_clicked)
         actions_row.addWidget(self.view_analytics_btn)
         
@@ -297,9 +300,9 @@ class DashboardWidget(QWidget):
     
     def _on_view_analytics_clicked(self) -> None:
         """Handle click on View Detailed Analytics button."""
-        if hasattr(self.view_analytics_btn, 'dataset_id') and self.view_analytics_btn.dataset_id:
+        if self._analytics_dataset_id:
             # Emit navigation with dataset_id
-            self.navigate_to.emit(f"analysis:{self.view_analytics_btn.dataset_id}")
+            self.navigate_to.emit(f"analysis:{self._analytics_dataset_id}")
     
     def _on_toggle_changed(self, index: int) -> None:
         """Handle toggle button selection change."""
@@ -360,13 +363,22 @@ class DashboardWidget(QWidget):
     def _load_datasets(self) -> None:
         """Load datasets from API and populate the selector."""
         try:
-            data = self.api_client.get_datasets()
+            analytics = None
+            if self.view_mode == 'combined':
+                # The dataset list and the combined analytics are
+                # independent requests - fetch them concurrently so the
+                # wall-clock cost is the slower of the two, not the sum.
+                data, analytics = self.api_client.batch_get(
+                    ['/datasets/', '/datasets/dashboard/']
+                )
+            else:
+                data = self.api_client.get_datasets()
             # API returns {'count': X, 'results': [...]} or list directly
             if isinstance(data, list):
                 self.datasets = data
             else:
                 self.datasets = data.get('results', [])
-            
+
             self.view_combo.blockSignals(True)
             self.view_combo.clear()
             for ds in self.datasets:
@@ -374,7 +386,12 @@ class DashboardWidget(QWidget):
                 count = ds.get('row_count', 0)
                 self.view_combo.addItem(f"{name} ({count} records)", ds['id'])
             self.view_combo.blockSignals(False)
-            self._load_dashboard()
+
+            if analytics is not None:
+                if analytics.get('success', True):
+                    self._update_combined_view(analytics)
+            else:
+                self._load_dashboard()
         except Exception as e:
             print(f"Error loading datasets: {e}")
     
@@ -481,7 +498,7 @@ class DashboardWidget(QWidget):
         # Show view analytics button
         if hasattr(self, 'view_analytics_btn'):
             self.view_analytics_btn.setVisible(True)
-            self.view_analytics_btn.dataset_id = dataset_id
+            self._analytics_dataset_id = dataset_id
     
     def _update_stats(self, data: Dict[str, Any]) -> None:
         """Update statistics cards with data."""
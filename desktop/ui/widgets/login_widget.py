@@ -366,8 +366,7 @@ class LoginWidget(QWidget):
         
         username = self.username_input.text().strip()
         password = self.password_input.text().strip()
-        remember_me = self.remember_checkbox.isChecked()
-        
+
         # Validation
         if not username or not password:
             self._show_error("Please fill in all fields")
@@ -380,11 +379,6 @@ class LoginWidget(QWidget):
             response = self.api_client.login(username, password)
             
             if response.get('success'):
-                # If not remember me, clear tokens after this session ends
-                if not remember_me:
-                    self.auth_manager.set_session_only(True)
-                else:
-                    self.auth_manager.set_session_only(False)
                 self.login_success.emit()
             else:
                 self._show_error(response.get('error', 'Login failed'))